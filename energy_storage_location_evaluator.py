@@ -36,6 +36,7 @@ import inspect
 
 from qgis.core import QgsProcessingAlgorithm, QgsApplication
 from .energy_storage_location_evaluator_provider import EnergyStorageLocationEvaluatorProvider
+from .static_candidate import Candidate as StaticCandidate
 
 cmd_folder = os.path.split(inspect.getfile(inspect.currentframe()))[0]
 
@@ -50,6 +51,8 @@ class EnergyStorageLocationEvaluatorPlugin(object):
 
     def initProcessing(self):
         """Init Processing provider for QGIS >= 3.8."""
+        # Drop any transforms cached against a previous project context
+        StaticCandidate.reset_transform_cache()
         self.provider = EnergyStorageLocationEvaluatorProvider()
         QgsApplication.processingRegistry().addProvider(self.provider)
 
@@ -30,6 +30,14 @@ __copyright__ = '(C) 2025 by Cristian Melendez'
 
 __revision__ = '$Format:%H$'
 
+import math
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+
+import numpy as np
+
 from qgis.PyQt.QtCore import (QCoreApplication, QVariant)
 
 from qgis.core import (QgsProcessing,
@@ -52,16 +60,60 @@ from qgis.core import (QgsProcessing,
                        QgsCoordinateTransform,
                        QgsCoordinateReferenceSystem,
                        QgsGeometry,
-                       QgsRectangle
+                       QgsRectangle,
+                       QgsSpatialIndex
                        )
 
 # Import both candidate classes - each model has its own dedicated candidate class
 from .mobile_candidate import Candidate as MobileCandidate
 from .static_candidate import Candidate as StaticCandidate
-from .static_model import StaticEnergyStorageEvaluator
+from .static_candidate import (configure_infrastructure_index,
+                               configure_census_index,
+                               configure_zone_index)
+from .static_model import StaticEnergyStorageEvaluator, _QueuedFeedback
 from .mobile_model import MobileEnergyStorageEvaluator
 
 
+# Cross-run cache of per-layer spatial structures. Users iterating algorithm
+# parameters re-run against identical input layers; rebuilding indexes and
+# coordinate maps for them every run is pure waste. Entries are keyed by layer
+# id, CRS, and provider modification time so edited layers miss the cache.
+_SPATIAL_CACHE = {}
+_SPATIAL_CACHE_MAX = 16
+
+# Characters that are not valid in output field names; stripped in one
+# C-level substitution instead of a per-character Python check
+_UNSAFE_FIELD_CHARS = re.compile(r'[^A-Za-z0-9_]+')
+
+# Output schemas keyed by the names that determine them; identical re-runs
+# skip rebuilding the whole QgsFields structure. Callers always receive a
+# copy so sinks never share mutable field state
+_OUTPUT_FIELDS_CACHE = {}
+
+
+def _layer_cache_key(layer):
+    """
+    Build a cache key that changes when the layer's data could have.
+
+    Returns None when the layer cannot be cached safely across runs: a
+    provider without a usable lastModified stamp (memory layers, database
+    providers) or an open edit session gives no way to detect that the
+    feature set changed, so such layers must be re-read every run.
+    """
+    if layer.isEditable():
+        return None
+    provider = layer.dataProvider()
+    if provider is None:
+        return None
+    # lastModified() exists on every vector provider; the ones that cannot
+    # track changes (memory, database backends) report an invalid QDateTime,
+    # so validity is the real test, not the method's presence
+    last_modified = provider.lastModified()
+    if not last_modified.isValid():
+        return None
+    return (layer.id(), layer.crs().authid(), last_modified.toMSecsSinceEpoch())
+
+
 class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
     """
     This algorithm evaluates potential locations for energy storage systems.
@@ -78,6 +130,7 @@ class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
     DISTANCE_METHOD = 'DISTANCE_METHOD'
     CANDIDATES_LAYER = 'CANDIDATES_LAYER'
     BUFFER_DISTANCE = 'BUFFER_DISTANCE'
+    BUFFER_SEGMENTS = 'BUFFER_SEGMENTS'
     CRITICAL_INFRASTRUCTURES = 'CRITICAL_INFRASTRUCTURES'
     INFRASTRUCTURE_WEIGHTS = 'INFRASTRUCTURE_WEIGHTS'
     CENSUS_DATA_LAYER = 'CENSUS_DATA_LAYER'
@@ -148,6 +201,19 @@ class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
             )
         )
 
+        # Buffer Segments - accuracy vs. speed trade-off for the static buffers.
+        # 12 segments per quarter circle keeps the area error below 1% while
+        # cutting the vertex count (and GEOS intersection cost) 3x vs. 36
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.BUFFER_SEGMENTS,
+                self.tr('Buffer segments per quarter circle (Static Energy Storage Only)'),
+                QgsProcessingParameterNumber.Integer,
+                defaultValue=12,
+                minValue=4
+            )
+        )
+
         # Critical Infrastructure Layers - required for both models
         self.addParameter(
             QgsProcessingParameterMultipleLayers(
@@ -213,18 +279,73 @@ class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
             )
         )
 
-    def safe_field_name(self, layer_name):
+    def _build_spatial_cache(self, layers):
+        """
+        Build a spatial index plus feature snapshot for each layer.
+
+        Scanning every layer feature per candidate makes evaluation
+        O(candidates x features). With one QgsSpatialIndex per layer, each
+        candidate only pays for a bounding-box query plus exact predicates on
+        the few features it returns.
+
+        Point coordinates are extracted once per layer alongside the index,
+        so distance calculations read plain (x, y) tuples instead of going
+        back through geometry().asPoint() for every candidate that hits the
+        same feature.
+
+        Args:
+            layers: Iterable of vector layers
+
+        Returns:
+            dict: layer id -> (QgsSpatialIndex, {feature id: QgsFeature},
+                {feature id: (x, y)})
+        """
+        cache = {}
+        for layer in layers:
+            # A None key marks a layer with no reliable modification stamp;
+            # its snapshot is built for this run but never stored, so edits
+            # can never be served from stale cached features
+            key = _layer_cache_key(layer)
+            snapshot = _SPATIAL_CACHE.get(key) if key is not None else None
+            if snapshot is None:
+                features = {}
+                coords = {}
+                index = QgsSpatialIndex()
+                for feature in layer.getFeatures():
+                    features[feature.id()] = feature
+                    index.addFeature(feature)
+                    geom = feature.geometry()
+                    if (QgsWkbTypes.geometryType(geom.wkbType()) == QgsWkbTypes.PointGeometry
+                            and not geom.isMultipart()):
+                        point = geom.asPoint()
+                        coords[feature.id()] = (point.x(), point.y())
+                snapshot = (index, features, coords)
+                if key is not None:
+                    if len(_SPATIAL_CACHE) >= _SPATIAL_CACHE_MAX:
+                        # Evict the oldest entry; repeat runs touch few layers
+                        _SPATIAL_CACHE.pop(next(iter(_SPATIAL_CACHE)))
+                    _SPATIAL_CACHE[key] = snapshot
+            cache[layer.id()] = snapshot
+        return cache
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def safe_field_name(layer_name):
         """
         Convert a layer name to a safe field name.
-        
+
+        The conversion is deterministic and the same layer names come through
+        repeatedly (infrastructure fields, zone fields, aliases), so results
+        are memoized for the lifetime of the process.
+
         Args:
             layer_name (str): Original layer name
-            
+
         Returns:
             str: Safe field name with spaces replaced and special characters removed
         """
         # Replace spaces with underscores and remove special characters
-        return ''.join([c if c.isalnum() or c == '_' else '' for c in layer_name.replace(' ', '_')])
+        return _UNSAFE_FIELD_CHARS.sub('', layer_name.replace(' ', '_'))
 
     def _initialize_output_fields(self):
         """
@@ -248,32 +369,34 @@ class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
             weights_str (str): Comma-separated weights
             expected_count (int): Expected number of weights
             weight_type (str): Type of weights for error messages
-            
+
         Returns:
-            list: Normalized weights
-            
+            numpy.ndarray: Normalized weights, ready for vectorized scoring
+
         Raises:
             QgsProcessingException: If weights are invalid
         """
         try:
-            weights = [float(w) for w in weights_str.split(',')]
+            weights = np.array(weights_str.split(','), dtype=np.float64)
         except ValueError:
             raise QgsProcessingException(f"{weight_type} weights must be numeric values separated by commas.")
-        
-        if len(weights) != expected_count:
+
+        if weights.size != expected_count:
             raise QgsProcessingException(
-                f"The number of {weight_type.lower()} weights ({len(weights)}) does not match "
+                f"The number of {weight_type.lower()} weights ({weights.size}) does not match "
                 f"the expected count ({expected_count}).")
-        
-        if not 0.999 <= sum(weights) <= 1.001:
+
+        # One exact pass over the array; fsum tracks partials so the check is
+        # not thrown off by accumulation order, and the same sum normalizes
+        weight_sum = math.fsum(weights)
+        if not 0.999 <= weight_sum <= 1.001:
             raise QgsProcessingException(
-                f"{weight_type} weights sum to {sum(weights)}, but they must sum to 1.0.")
-        
+                f"{weight_type} weights sum to {weight_sum}, but they must sum to 1.0.")
+
         # Normalize weights to exactly 1.0
-        weight_sum = sum(weights)
         if weight_sum != 1.0:
-            weights = [w/weight_sum for w in weights]
-            
+            weights *= 1.0 / weight_sum
+
         return weights
 
     def _add_infrastructure_fields(self, output_fields, infra_layers, evaluation_type):
@@ -328,39 +451,56 @@ class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
             
         return output_fields
 
-    def _add_census_fields(self, output_fields, census_layer):
+    def _classify_census_fields(self, census_layer):
         """
-        Add census-related fields and extract census variables.
-        
-        Both models use the same approach for census data, as specified in 
-        sections 3.2.4.2.2 and 3.3.4.2.2.
-        
+        Classify which fields of the census layer are scoring variables.
+
+        This is the single source of truth for what counts as a census
+        variable: every numeric field except id/fid identifiers. The output
+        schema, weight validation, and the scoring passes all consume this
+        one list, so they can never disagree about the variable set (the old
+        index-based scan in _add_census_fields did).
+
+        Args:
+            census_layer: Census data layer (may be None)
+
+        Returns:
+            list: Census variable field names, in layer field order
+        """
+        if not census_layer:
+            return []
+        return [field.name() for field in census_layer.fields()
+                if field.isNumeric() and not field.name().lower() in ('id', 'fid')]
+
+    def _add_census_fields(self, output_fields, census_variables):
+        """
+        Add census-related fields to the output structure.
+
+        Both models use the same approach for census data, as specified in
+        sections 3.2.4.2.2 and 3.3.4.2.2. The variable names are extracted
+        once in processAlgorithm and shared with the scoring passes, so the
+        output fields always line up with the variables actually scored.
+
         Args:
             output_fields (QgsFields): Fields to add to
-            census_layer: Census data layer
-            
+            census_variables (list): Census variable names
+
         Returns:
-            tuple: (updated fields, list of census variables)
+            QgsFields: Updated fields
         """
-        census_fields = census_layer.fields()
-        census_variables = []
-        
-        for i in range(6, len(census_fields)):
-            field_name = census_fields.at(i).name()
-            census_variables.append(field_name)
-            
+        for field_name in census_variables:
             # Create short field names with full aliases
             short_name = field_name[:8]
-            
+
             val_field = QgsField(f'{short_name}_Val', QVariant.Double)
             val_field.setAlias(f'{field_name} Value')
             output_fields.append(val_field)
-            
+
             score_field = QgsField(f'{short_name}_Scr', QVariant.Double)
             score_field.setAlias(f'{field_name} Score')
             output_fields.append(score_field)
-            
-        return output_fields, census_variables
+
+        return output_fields
 
     def _add_zone_fields(self, output_fields, zone_layers):
         """
@@ -413,38 +553,49 @@ class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
         for i, layer in enumerate(infra_layers):
             feedback.pushInfo(f"Infrastructure layer {i+1} ({layer.name()}) CRS: {layer.crs().authid()}")
 
-    def _prepare_output_fields(self, candidates_layer, infra_layers, evaluation_type, census_layer):
+    def _prepare_output_fields(self, candidates_layer, infra_layers, evaluation_type, census_vars,
+                               zone_layers):
         """
         Prepare the complete set of output fields for the result layer.
-        
+
         This combines fields from infrastructure, census data, and critical zones
         based on the evaluation type (static or mobile).
-        
+
         Args:
             candidates_layer: Candidate layer
             infra_layers: List of infrastructure layers
             evaluation_type (int): 0 for static, 1 for mobile
-            census_layer: Census data layer
-            
+            census_vars (list): Census variable names extracted from the census layer
+            zone_layers (list): Critical zone layers, as already resolved by
+                processAlgorithm (avoids a second parameterAsLayerList round-trip)
+
         Returns:
             QgsFields: Complete set of output fields
         """
+        # The schema is fully determined by these names and the model type,
+        # so identical re-runs can reuse the built structure
+        cache_key = (evaluation_type,
+                     tuple(layer.name() for layer in infra_layers),
+                     tuple(census_vars),
+                     tuple(layer.name() for layer in zone_layers))
+        cached = _OUTPUT_FIELDS_CACHE.get(cache_key)
+        if cached is not None:
+            return QgsFields(cached)
+
         # Start with base fields
         output_fields = self._initialize_output_fields()
-        
+
         # Add infrastructure fields - different between static and mobile
         output_fields = self._add_infrastructure_fields(output_fields, infra_layers, evaluation_type)
-        
-        # Add census fields if census layer is provided - same for both models
-        if census_layer:
-            output_fields, census_variables = self._add_census_fields(output_fields, census_layer)
-        
+
+        # Add census fields if census variables were found - same for both models
+        if census_vars:
+            output_fields = self._add_census_fields(output_fields, census_vars)
+
         # Add zone fields - same for both models
-        zone_layers = self.parameterAsLayerList(
-            self.parameters, self.CRITICAL_ZONES, self.context
-        )
         output_fields = self._add_zone_fields(output_fields, zone_layers)
-        
+
+        _OUTPUT_FIELDS_CACHE[cache_key] = QgsFields(output_fields)
         return output_fields
 
     def processAlgorithm(self, parameters, context, feedback):
@@ -499,6 +650,7 @@ class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
             if evaluation_type == 0:  # Static Energy Storage Model
                 # For static model, buffer distance and distance method are required
                 buffer_distance = self.parameterAsDouble(parameters, self.BUFFER_DISTANCE, context)
+                buffer_segments = self.parameterAsInt(parameters, self.BUFFER_SEGMENTS, context)
                 distance_method = self.parameterAsInt(parameters, self.DISTANCE_METHOD, context)
                 
                 if buffer_distance <= 0:
@@ -517,20 +669,27 @@ class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
                 if not coverage_area:
                     raise QgsProcessingException("Coverage area is required for mobile energy storage evaluation")
                 
-                # Extract coverage geometry
-                coverage_geom = None
-                for feature in coverage_area.getFeatures():
-                    coverage_geom = feature.geometry()
-                    break
-                
+                # Extract coverage geometry. Only the first feature is used,
+                # so tell the provider up front to fetch a single feature
+                # instead of preparing a full-layer iteration
+                coverage_request = QgsFeatureRequest().setLimit(1)
+                coverage_feature = next(coverage_area.getFeatures(coverage_request), None)
+                coverage_geom = coverage_feature.geometry() if coverage_feature else None
+
                 if not coverage_geom:
                     raise QgsProcessingException("Empty coverage area geometry")
                 
                 feedback.pushInfo("Using Mobile Energy Storage Model with user-defined coverage area")
             
+            # Classify census variables once; the same list drives the output
+            # schema, weight validation, and the census scoring pass
+            census_vars = self._classify_census_fields(census_layer)
+            if census_layer and not census_vars:
+                feedback.pushWarning("No numeric census variables found in census layer")
+
             # Create output fields structure based on evaluation type
-            fields = self._prepare_output_fields(candidates_layer, infra_layers, 
-                                              evaluation_type, census_layer)
+            fields = self._prepare_output_fields(candidates_layer, infra_layers,
+                                              evaluation_type, census_vars, zone_layers)
             
             # Create the sink (output layer) with appropriate geometry type
             if evaluation_type == 0:  # Static Energy Storage - uses polygon (buffer) outputs
@@ -559,38 +718,61 @@ class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
             candidates = []
             total_features = candidates_layer.featureCount()
             feedback.pushInfo(f"Processing {total_features} candidate locations")
+
+            # Candidates only ever read their id/name attributes (plus
+            # geometry), so ask the provider for just those and skip
+            # deserializing the rest of each row
+            candidate_request = QgsFeatureRequest().setSubsetOfAttributes(
+                ['Id', 'ID', 'id', 'Name', 'name', 'NAME'], candidates_layer.fields()
+            )
             
-            for current, feature in enumerate(candidates_layer.getFeatures()):
-                if feedback.isCanceled():
-                    break
-                    
+            if evaluation_type == 0:  # Static Energy Storage
+                # Register infrastructure, zone and census names so candidate
+                # score arrays are preallocated with one slot per entry, in
+                # order. The census call must run even when the list is empty:
+                # the shared index persists across runs in one QGIS session,
+                # and a stale width from a previous run would shift the output
+                # columns of a census-less run
+                configure_infrastructure_index([layer.name() for layer in infra_layers])
+                configure_zone_index([layer.name() for layer in zone_layers])
+                configure_census_index(census_vars)
+
+                # For static model, buffer_distance is required (section 3.2.2.2).
+                # Buffers are built for all candidates in a single batch pass so
+                # the transform setup cost is paid once (see Candidate.build_many)
                 try:
-                    if evaluation_type == 0:  # Static Energy Storage
-                        # For static model, buffer_distance is required (section 3.2.2.2)
-                        candidate = StaticCandidate(feature, buffer_distance_meters, feedback)
-                    else:  # Mobile Energy Storage
+                    candidates = StaticCandidate.build_many(
+                        candidates_layer.getFeatures(candidate_request), buffer_distance_meters, feedback,
+                        source_crs=candidates_layer.sourceCrs(),
+                        segments=buffer_segments
+                    )
+                except Exception as e:
+                    feedback.reportError(f"Error initializing candidates: {str(e)}")
+                feedback.setProgress(20)
+            else:  # Mobile Energy Storage
+                # setProgress is a signal emission across the binding layer;
+                # cap updates at ~100 per phase so the loop cost stays with
+                # the real work rather than progress reporting
+                init_step = max(1, total_features // 100)
+                for current, feature in enumerate(candidates_layer.getFeatures(candidate_request)):
+                    if feedback.isCanceled():
+                        break
+
+                    try:
                         # For mobile model, buffer parameter is not used (section 3.3.2.2)
                         # but we still pass the parameter for API compatibility
                         candidate = MobileCandidate(feature, None, feedback)
-                        
-                    candidates.append(candidate)
-                    feedback.setProgress(int(current * 20 / total_features))  # 0-20% progress
-                    
-                except Exception as e:
-                    feedback.reportError(f"Error initializing candidate {current}: {str(e)}")
-                    continue
+                        candidates.append(candidate)
+                        if current % init_step == 0:
+                            feedback.setProgress(int(current * 20 / total_features))  # 0-20% progress
+
+                    except Exception as e:
+                        feedback.reportError(f"Error initializing candidate {current}: {str(e)}")
+                        continue
             
-            # Process census data and extract variables
+            # Validate weights (census variables were registered above,
+            # before the candidates were built)
             try:
-                census_vars = []
-                if census_layer:
-                    census_fields = census_layer.fields()
-                    census_vars = [field.name() for field in census_fields 
-                                 if field.isNumeric() and not field.name().lower() in ('id', 'fid')]
-                    
-                    if not census_vars:
-                        feedback.pushWarning("No numeric census variables found in census layer")
-                
                 # Validate weights through the model
                 infra_weights_list, census_weights_list = model.validate_weights(
                     infra_weights, census_weights,
@@ -599,50 +781,119 @@ class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
             except Exception as e:
                 raise QgsProcessingException(f"Weight validation failed: {str(e)}")
             
+            # Throttle progress updates to ~100 emissions per phase
+            progress_step = max(1, len(candidates) // 100)
+
             # Process census data if available
             if census_layer and census_vars:
                 feedback.pushInfo(f"Processing census data with {len(census_vars)} variables")
-                for i, candidate in enumerate(candidates):
-                    if feedback.isCanceled():
-                        break
+
+                # Index the census layer once: each candidate then asks the
+                # index for the handful of polygons near it instead of
+                # scanning the whole layer (census sources come through
+                # parameterAsSource, so they bypass the layer spatial cache)
+                census_index = QgsSpatialIndex()
+                census_by_id = {}
+                census_geoms = {}
+                for census_feature in census_layer.getFeatures():
+                    fid = census_feature.id()
+                    census_by_id[fid] = census_feature
+                    census_index.addFeature(census_feature)
+                    # Validate each census geometry once here instead of once
+                    # per candidate inside the intersection loop
+                    geom = census_feature.geometry()
+                    census_geoms[fid] = geom if geom.isGeosValid() else geom.makeValid()
+                census_field_names = set(census_layer.fields().names())
+                # Parsed-values cache shared across candidates; neighbouring
+                # candidates usually land in the same tract
+                census_cache = {}
+
+                # Candidates are independent here and the heavy predicates run
+                # inside GEOS with the GIL released, so the loop fans out to a
+                # thread pool. Workers log into a queue that the consuming
+                # loop replays, since Qt feedback is not thread-safe. The
+                # shared parse cache is only touched with atomic dict get/set,
+                # so the worst concurrent case is a duplicated parse.
+                queued = _QueuedFeedback()
+
+                def process_candidate(candidate):
                     try:
-                        self._process_census_data(candidate, census_layer, census_vars)
+                        self._process_census_data(candidate, census_layer, census_vars,
+                                                  census_index=census_index,
+                                                  census_by_id=census_by_id,
+                                                  field_names=census_field_names,
+                                                  census_geoms=census_geoms,
+                                                  census_cache=census_cache,
+                                                  log=queued)
                     except Exception as e:
-                        feedback.reportError(f"Error processing census data for candidate {candidate.id}: {str(e)}")
-                    
-                    if i % 10 == 0:  # Update progress every 10 candidates
-                        feedback.setProgress(20 + int(i * 10 / len(candidates)))  # 20-30% progress
+                        queued.reportError(f"Error processing census data for candidate {candidate.id}: {str(e)}")
+
+                census_workers = min(os.cpu_count() or 1, max(1, len(candidates)))
+                if census_workers > 1 and not feedback.isCanceled():
+                    # submit + as_completed instead of map: map dispatches the
+                    # whole batch up front, so a cancel would still wait for
+                    # every candidate. The consuming loop checks cancellation
+                    # between completed candidates, drops the still-pending
+                    # futures, and replays queued worker messages as it goes
+                    with ThreadPoolExecutor(max_workers=census_workers) as pool:
+                        futures = [pool.submit(process_candidate, candidate)
+                                   for candidate in candidates]
+                        for i, _ in enumerate(as_completed(futures)):
+                            if feedback.isCanceled():
+                                for pending in futures:
+                                    pending.cancel()
+                                break
+                            if i % progress_step == 0:
+                                feedback.setProgress(20 + int(i * 10 / len(candidates)))  # 20-30% progress
+                                queued.flush(feedback)
+                else:
+                    for i, candidate in enumerate(candidates):
+                        if feedback.isCanceled():
+                            break
+                        process_candidate(candidate)
+                        if i % progress_step == 0:
+                            feedback.setProgress(20 + int(i * 10 / len(candidates)))  # 20-30% progress
+                queued.flush(feedback)
             
             # Evaluate critical zones
             try:
                 feedback.pushInfo(f"Evaluating {len(zone_layers)} critical zones")
-                model.evaluate_critical_zones(candidates, zone_layers, zone_scores)
+                # One spatial index per zone layer: candidate points then only
+                # test the polygons whose bounding boxes contain them
+                zone_cache = self._build_spatial_cache(zone_layers)
+                model.evaluate_critical_zones(candidates, zone_layers, zone_scores,
+                                              spatial_cache=zone_cache)
             except Exception as e:
                 feedback.reportError(f"Error evaluating critical zones: {str(e)}")
                 # Continue despite errors
             
             # Evaluate infrastructures based on model type
             feedback.pushInfo(f"Evaluating {len(infra_layers)} infrastructure layers")
-            for i, candidate in enumerate(candidates):
-                if feedback.isCanceled():
-                    break
+            if evaluation_type == 0:  # Static model
+                # Index infrastructure layers once up front; each candidate then
+                # pays a bounding-box query instead of a full layer scan. The
+                # batch call runs layer-major so per-layer setup is paid once
+                infra_cache = self._build_spatial_cache(infra_layers)
                 try:
-                    if evaluation_type == 0:  # Static model
-                        # Static model needs buffer_distance and distance_method
-                        model.evaluate_infrastructure(
-                            candidate, infra_layers, infra_weights_list, 
-                            buffer_distance_meters, distance_method
-                        )
-                    else:  # Mobile model
-                        # Mobile model needs coverage_geom
-                        model.evaluate_infrastructure(
-                            candidate, infra_layers, infra_weights_list, coverage_geom
-                        )
+                    model.evaluate_infrastructure_batch(
+                        candidates, infra_layers, infra_weights_list,
+                        buffer_distance_meters, distance_method,
+                        spatial_cache=infra_cache
+                    )
                 except Exception as e:
-                    feedback.reportError(f"Error evaluating infrastructure for candidate {candidate.id}: {str(e)}")
-                
-                if i % 10 == 0:  # Update progress every 10 candidates
-                    feedback.setProgress(30 + int(i * 40 / len(candidates)))  # 30-70% progress
+                    feedback.reportError(f"Error evaluating infrastructure: {str(e)}")
+                feedback.setProgress(70)
+            else:  # Mobile model
+                # All candidate/infrastructure travel times come back from
+                # one OSRM table request per layer instead of one route
+                # request per pair
+                try:
+                    model.evaluate_infrastructure_batch(
+                        candidates, infra_layers, infra_weights_list, coverage_geom
+                    )
+                except Exception as e:
+                    feedback.reportError(f"Error evaluating infrastructure: {str(e)}")
+                feedback.setProgress(70)
             
             # Normalize and calculate final scores
             try:
@@ -656,40 +907,59 @@ class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
                 feedback.reportError(f"Error calculating final scores: {str(e)}")
                 raise
             
-            # Write results to output layer
+            # Write results to output layer. This is the only pass that
+            # touches candidates after scoring: evaluation cannot stream into
+            # it because min-max normalization needs the full batch first.
+            # Features are accumulated and flushed through addFeatures in
+            # chunks: one Python->C++ crossing per chunk instead of per
+            # feature, and drivers that batch commits (e.g. GPKG) get full
+            # batches. Prepared GEOS engines are released as candidates are
+            # written so the working set shrinks while the sink fills
             feedback.pushInfo("Writing results to output layer")
+            write_chunk = 1000
+            out_feats = []
+            # Build the fields-initialized feature once; each row then
+            # copy-constructs from the template instead of re-resolving the
+            # schema per candidate. Full in-place reuse of one feature is not
+            # possible here because the chunked batch holds references until
+            # it is flushed
+            feat_template = QgsFeature(fields)
             for i, candidate in enumerate(candidates):
-                if feedback.isCanceled():
-                    break
+                # Cancellation and progress share one gated branch so the
+                # steady-state iteration does no binding crossings at all
+                if i % progress_step == 0:
+                    if feedback.isCanceled():
+                        break
+                    feedback.setProgress(70 + int(i * 30 / len(candidates)))  # 70-100% progress
                 try:
-                    feat = QgsFeature(fields)
-                    
+                    feat = QgsFeature(feat_template)
+
                     # Use the appropriate geometry based on the model type
                     if evaluation_type == 0:  # Static Energy Storage - use buffer polygon
-                        if not candidate.buffer:
-                            feedback.reportError(f"Missing buffer geometry for candidate {candidate.id}")
+                        # Validity was established when the buffer was built,
+                        # so the write loop only checks the recorded flag
+                        if not getattr(candidate, 'buffer_is_valid', False):
+                            feedback.reportError(f"Missing or invalid buffer geometry for candidate {candidate.id}")
                             continue
-                            
-                        if not candidate.buffer.isGeosValid():
-                            feedback.reportError(f"Invalid buffer geometry for candidate {candidate.id}")
-                            continue
-                            
+
                         feat.setGeometry(candidate.buffer)
-                        feedback.pushInfo(f"Adding buffer polygon for candidate {candidate.id}, area: {candidate.buffer.area():.2f}m²")
+                        candidate.release_prepared_buffer()
                     else:  # Mobile Energy Storage - use point geometry
                         feat.setGeometry(candidate.feature.geometry())
-                    
+
                     # Generate output attributes from candidate
                     attrs = candidate.generate_output_attributes()
                     feat.setAttributes(attrs)
-                    
-                    if not sink.addFeature(feat, QgsFeatureSink.FastInsert):
-                        feedback.reportError(f"Failed to add feature for candidate {candidate.id}")
+
+                    out_feats.append(feat)
+                    if len(out_feats) >= write_chunk:
+                        self._flush_output_batch(sink, out_feats, feedback)
+                        out_feats = []
                 except Exception as e:
                     feedback.reportError(f"Error writing output for candidate {candidate.id}: {str(e)}")
-                
-                if i % 10 == 0:  # Update progress every 10 candidates
-                    feedback.setProgress(70 + int(i * 30 / len(candidates)))  # 70-100% progress
+
+            if out_feats:
+                self._flush_output_batch(sink, out_feats, feedback)
             
             feedback.pushInfo("Energy Storage Location Evaluation completed successfully")
             return {'OUTPUT': dest_id}
@@ -701,58 +971,139 @@ class EnergyStorageLocationEvaluatorAlgorithm(QgsProcessingAlgorithm):
             feedback.reportError(f"Critical error in processAlgorithm: {str(e)}")
             raise
 
-    def _process_census_data(self, candidate, census_layer, census_vars):
+    def _flush_output_batch(self, sink, batch, feedback):
+        """
+        Write a batch of output features to the sink in one call.
+
+        Falls back to per-feature inserts only when the batched call is
+        rejected, so a single bad feature cannot sink a whole chunk.
+
+        Args:
+            sink: QgsFeatureSink receiving the output features
+            batch: List of QgsFeature objects to write
+            feedback: Feedback mechanism for error reporting
+        """
+        if sink.addFeatures(batch, QgsFeatureSink.FastInsert):
+            return
+        for feat in batch:
+            if not sink.addFeature(feat, QgsFeatureSink.FastInsert):
+                feedback.reportError(f"Failed to add output feature {feat.id()}")
+
+    def _process_census_data(self, candidate, census_layer, census_vars,
+                             census_index=None, census_by_id=None, field_names=None,
+                             census_geoms=None, census_cache=None, log=None):
         """
         Process census data for a candidate location.
-        
+
         For both models, this identifies the census area that intersects with
         the candidate and extracts the relevant census variables.
-        
+
         Args:
             candidate: Candidate object (static or mobile)
             census_layer: Census data layer
             census_vars: List of census variable names to extract
-            
+            census_index: Optional QgsSpatialIndex over the census layer;
+                when given with census_by_id, only features whose bounding
+                box overlaps the candidate reach the exact intersects test
+            census_by_id: Optional {feature id: feature} snapshot matching
+                census_index
+            field_names: Optional precomputed set of the census layer's
+                field names (saves re-listing them per feature)
+            census_geoms: Optional {feature id: geometry} map of census
+                geometries validated once up front, so the per-feature
+                isGeosValid/makeValid work is skipped here
+            census_cache: Optional {feature id: {var_name: float}} cache of
+                parsed census values; candidates falling in a tract that was
+                already parsed reuse its values instead of re-converting them
+            log: Optional feedback-like message sink; worker threads pass a
+                _QueuedFeedback here since Qt feedback is not thread-safe
+
         Raises:
             Exception: If there's an error processing the census data
         """
+        if log is None:
+            log = self.feedback
         try:
             # Get candidate geometry
             candidate_geom = candidate.feature.geometry()
-            
+
             if not candidate_geom.isGeosValid():
                 candidate_geom = candidate_geom.makeValid()
-            
-            found_intersection = False
-            
-            # For each census feature, check if it intersects with the candidate
-            for census_feature in census_layer.getFeatures():
+
+            if field_names is None:
+                field_names = set(census_layer.fields().names())
+
+            # Filter the requested variables against the layer schema once,
+            # instead of probing membership per variable inside the parse loop
+            census_vars = [v for v in census_vars if v in field_names]
+
+            def resolve_geom(census_feature):
+                if census_geoms is not None:
+                    return census_geoms[census_feature.id()]
                 census_geom = census_feature.geometry()
-                
                 if not census_geom.isGeosValid():
                     census_geom = census_geom.makeValid()
-                
-                if census_geom.intersects(candidate_geom):
-                    # Found intersecting census area, extract the values
+                return census_geom
+
+            # Each candidate belongs to exactly one census area, so a
+            # point-in-polygon probe on the centroid is enough to pick it
+            # and is far cheaper than polygon-polygon intersection against
+            # the full buffer ring
+            centroid = candidate_geom.centroid()
+            matched = None
+
+            if census_index is not None and census_by_id is not None:
+                census_features = [census_by_id[fid]
+                                   for fid in census_index.intersects(centroid.boundingBox())]
+            else:
+                census_features = census_layer.getFeatures()
+
+            for census_feature in census_features:
+                if resolve_geom(census_feature).contains(centroid):
+                    matched = census_feature
+                    break
+
+            if matched is None:
+                # Centroid fell between tracts (boundary slivers, coastal
+                # gaps); fall back to the exact intersects probe over the
+                # whole candidate geometry with a prepared engine
+                engine = QgsGeometry.createGeometryEngine(candidate_geom.constGet())
+                engine.prepareGeometry()
+                if census_index is not None and census_by_id is not None:
+                    census_features = (census_by_id[fid]
+                                       for fid in census_index.intersects(candidate_geom.boundingBox()))
+                else:
+                    census_features = census_layer.getFeatures()
+                for census_feature in census_features:
+                    if engine.intersects(resolve_geom(census_feature).constGet()):
+                        matched = census_feature
+                        break
+
+            if matched is not None:
+                # Found the census area; parse its values once and reuse
+                # them for every candidate in the same tract
+                fid = matched.id()
+                parsed = census_cache.get(fid) if census_cache is not None else None
+                if parsed is None:
+                    parsed = {}
                     for var_name in census_vars:
-                        if var_name in census_feature.fields().names():
-                            value = census_feature[var_name]
-                            if value is not None and value != "NULL":
-                                try:
-                                    value_float = float(value)
-                                    # Store the raw census data value
-                                    candidate.set_census_data(var_name, value_float)
-                                except (ValueError, TypeError):
-                                    self.feedback.pushInfo(f"Could not convert census value '{value}' to number")
-                    
-                    found_intersection = True
-                    break  # Assuming each candidate is in only one census area
-            
-            if not found_intersection:
-                self.feedback.pushWarning(f"No intersecting census area found for candidate {candidate.id}")
-                
+                        value = matched[var_name]
+                        if value is not None and value != "NULL":
+                            try:
+                                parsed[var_name] = float(value)
+                            except (ValueError, TypeError):
+                                log.pushInfo(f"Could not convert census value '{value}' to number")
+                    if census_cache is not None:
+                        census_cache[fid] = parsed
+
+                for var_name, value_float in parsed.items():
+                    # Store the raw census data value
+                    candidate.set_census_data(var_name, value_float)
+            else:
+                log.pushWarning(f"No intersecting census area found for candidate {candidate.id}")
+
         except Exception as e:
-            self.feedback.reportError(f"Error in _process_census_data: {str(e)}")
+            log.reportError(f"Error in _process_census_data: {str(e)}")
             raise
 
     def name(self):
@@ -7,6 +7,14 @@ attributes and scoring mechanisms as described in methodology section 3.3.
 from qgis.core import QgsGeometry, QgsProject, QgsCoordinateReferenceSystem, QgsCoordinateTransform
 
 class Candidate:
+    # Fixed attribute layout: thousands of candidates exist at once, and a
+    # slotted instance skips the per-object __dict__ allocation
+    __slots__ = ('feature', 'feedback', 'id', 'field_id', 'field_name',
+                 'buffer', 'infra_count', 'infra_raw', 'infra_final',
+                 'infra_duration', 'census_data', 'census_scores',
+                 'critical_zones', 'final_score', 'total_census_score',
+                 'total_infra_score', 'total_zone_score', 'verbose')
+
     def __init__(self, feature, buffer_distance, feedback=None):
         """
         Initialize the mobile candidate with its feature.
@@ -25,22 +33,38 @@ class Candidate:
         """
         self.feature = feature
         self.feedback = feedback
-        
+
+        # Per-candidate logging formats an f-string and crosses the Qt signal
+        # boundary on every construction; the detail only runs when the
+        # feedback is verbose, matching the static candidate
+        self.verbose = feedback is not None and getattr(feedback, 'isVerbose', lambda: False)()
+
         # Store the ID immediately for consistent access
         self.id = feature.id()  # Use native feature ID
         
-        # Check all possible ID field variations
-        if 'Id' in feature.fields().names():
-            self.field_id = feature['Id']
-        elif 'ID' in feature.fields().names():
-            self.field_id = feature['ID']
-        elif 'id' in feature.fields().names():
-            self.field_id = feature['id']
-        else:
-            self.field_id = self.id
-            
+        # Check all possible ID field variations. lookupField is a hashed O(1)
+        # lookup, avoiding repeated materialization of the full field-name list
+        fields = feature.fields()
+        self.field_id = self.id
+        for id_name in ('Id', 'ID', 'id'):
+            idx = fields.lookupField(id_name)
+            if idx >= 0:
+                self.field_id = feature[idx]
+                break
+
+        # Resolve the display name once as well, so output generation never
+        # goes back through string-indexed attribute lookups
+        self.field_name = None
+        for name_field in ('Name', 'name', 'NAME'):
+            idx = fields.lookupField(name_field)
+            if idx >= 0:
+                self.field_name = str(feature[idx])
+                break
+        if not self.field_name:
+            self.field_name = f'Candidate {self.field_id}'
+
         # Log ID assignment for debugging
-        if self.feedback:
+        if self.verbose:
             self.feedback.pushInfo(f"Initializing mobile candidate with ID: {self.id} (field ID: {self.field_id})")
         
         # Mobile candidates don't use a buffer - they operate within a shared coverage area
@@ -49,15 +73,21 @@ class Candidate:
         
         # Initialize score tracking with total_duration for mobile model
         # For the mobile model, we track travel times instead of distances
-        # as described in section 3.3.2.1 and 3.3.4.2.1
-        self.infrastructures = {}  # Will store count, raw_score, final_score, and total_duration
+        # as described in section 3.3.2.1 and 3.3.4.2.1.
+        # Infrastructure bookkeeping is stored as parallel dicts keyed by
+        # infrastructure name (one per field) rather than a dict of dicts;
+        # the `infrastructures` property exposes the nested view
+        self.infra_count = {}      # Infrastructure items within coverage
+        self.infra_raw = {}        # Raw scores (summed travel durations)
+        self.infra_final = {}      # Normalized and weighted scores
+        self.infra_duration = {}   # Total travel durations in seconds
         self.census_data = {}      # Raw census data values
         self.census_scores = {}    # Normalized and weighted census scores
         self.critical_zones = {}   # Critical zone direct modifiers
         self.final_score = 0       # Final combined score
-        self.total_census_score = 0  # Total census component
+        self.total_census_score = 0  # Total census component (kept running)
         self.total_infra_score = 0   # Total infrastructure component
-        self.total_zone_score = 0    # Total zone modifiers
+        self.total_zone_score = 0    # Total zone modifiers (kept running)
         
     def update_infrastructure_count(self, infra_name, count=0):
         """
@@ -71,14 +101,7 @@ class Candidate:
             infra_name: Name of the infrastructure type
             count: Number of infrastructure items found
         """
-        if infra_name not in self.infrastructures:
-            self.infrastructures[infra_name] = {
-                'count': 0,
-                'raw_score': 0,
-                'final_score': 0,
-                'total_duration': 0
-            }
-        self.infrastructures[infra_name]['count'] = count
+        self.infra_count[infra_name] = count
 
     def set_infrastructure_raw_score(self, infra_name, raw_score):
         """
@@ -94,14 +117,7 @@ class Candidate:
             infra_name: Name of the infrastructure type
             raw_score: The raw unweighted score (sum of travel times)
         """
-        if infra_name not in self.infrastructures:
-            self.infrastructures[infra_name] = {
-                'count': 0,
-                'raw_score': 0,
-                'final_score': 0,
-                'total_duration': 0
-            }
-        self.infrastructures[infra_name]['raw_score'] = raw_score
+        self.infra_raw[infra_name] = raw_score
 
     def set_infrastructure_score(self, infra_name, final_score, weight=1.0):
         """
@@ -116,16 +132,8 @@ class Candidate:
             final_score: The weighted normalized score
             weight: The weight applied (for information only)
         """
-        if infra_name not in self.infrastructures:
-            self.infrastructures[infra_name] = {
-                'count': 0,
-                'raw_score': 0,
-                'final_score': 0,
-                'total_duration': 0
-            }
-        
         # Store final score (already normalized and weighted)
-        self.infrastructures[infra_name]['final_score'] = final_score
+        self.infra_final[infra_name] = final_score
         
     def set_census_data_score(self, variable, weighted_score):
         """
@@ -139,8 +147,8 @@ class Candidate:
             variable: Census variable name
             weighted_score: The weighted normalized score for this census variable
         """
-        # Store in both places for backward compatibility during transition
-        self.census_data[variable + "_score"] = weighted_score
+        # Keep the census total running so queries never re-sum the dict
+        self.total_census_score += weighted_score - self.census_scores.get(variable, 0)
         self.census_scores[variable] = weighted_score
         
     def set_critical_zone_score(self, zone_type, score):
@@ -155,6 +163,8 @@ class Candidate:
             zone_type: Name of the critical zone
             score: Direct score modifier (can be positive or negative)
         """
+        # Keep the zone total running so queries never re-sum the dict
+        self.total_zone_score += score - self.critical_zones.get(zone_type, 0)
         self.critical_zones[zone_type] = score
         
     def calculate_final_score(self):
@@ -169,7 +179,6 @@ class Candidate:
         """
         infra_score = self.total_infra_score
         census_score = self.calculate_total_census_score()
-        self.total_zone_score = sum(self.critical_zones.values())  # Ensure we store the total zone score
         
         # Final score is the sum of infrastructure score, census score, and critical zone scores
         # Similar to the static model's approach, but with a different calculation for infrastructure scores
@@ -187,84 +196,44 @@ class Candidate:
         Returns:
             list: Attributes for the output feature
         """
-        # Get proper ID for the feature
-        feature_id = self.id  # Default to internal ID
-        
-        # Try different ID field variations
-        if 'Id' in self.feature.fields().names():
-            feature_id = self.feature['Id']
-            if self.feedback:
-                self.feedback.pushInfo(f"Using 'Id' field value: {feature_id}")
-        elif 'ID' in self.feature.fields().names():
-            feature_id = self.feature['ID'] 
-            if self.feedback:
-                self.feedback.pushInfo(f"Using 'ID' field value: {feature_id}")
-        elif 'id' in self.feature.fields().names():
-            feature_id = self.feature['id']
-            if self.feedback:
-                self.feedback.pushInfo(f"Using 'id' field value: {feature_id}")
-        else:
-            if self.feedback:
-                self.feedback.pushInfo(f"No Id field found, using internal ID: {feature_id}")
-        
-        # Get proper Name for the feature
-        feature_name = None
-        
-        # Try different Name field variations
-        if 'Name' in self.feature.fields().names():
-            feature_name = str(self.feature['Name'])
-            if self.feedback:
-                self.feedback.pushInfo(f"Using 'Name' field value: {feature_name}")
-        elif 'name' in self.feature.fields().names():
-            feature_name = str(self.feature['name'])
-            if self.feedback:
-                self.feedback.pushInfo(f"Using 'name' field value: {feature_name}")
-        elif 'NAME' in self.feature.fields().names():
-            feature_name = str(self.feature['NAME'])
-            if self.feedback:
-                self.feedback.pushInfo(f"Using 'NAME' field value: {feature_name}")
-        
-        # If no name was found, use Id as the name
-        if not feature_name:
-            feature_name = f'Candidate {feature_id}'
-            if self.feedback:
-                self.feedback.pushInfo(f"No Name field found, using ID as name: {feature_name}")
-        
-        # Start attributes list with ID and name
-        attributes = [feature_id, feature_name]
-        
-        # Add infrastructure scores
-        for infra_name, data in self.infrastructures.items():
-            attributes.append(data.get('count', 0))
-            attributes.append(data.get('raw_score', 0))
-            attributes.append(data.get('final_score', 0))
-        
+        # ID and name were resolved once in __init__ via integer field indices,
+        # so the row starts straight from the cached values. The row is
+        # pre-sized and filled by index so the list never reallocates.
+        attributes = [None] * (2 + 3 * len(self.infra_count) + 1
+                               + 2 * len(self.census_data)
+                               + len(self.critical_zones) + 3)
+        attributes[0] = self.field_id
+        attributes[1] = self.field_name
+        pos = 2
+
+        # Add infrastructure scores straight from the parallel dicts
+        for infra_name in self.infra_count:
+            attributes[pos] = self.infra_count[infra_name]
+            attributes[pos + 1] = self.infra_raw.get(infra_name, 0)
+            attributes[pos + 2] = self.infra_final.get(infra_name, 0)
+            pos += 3
+
         # Add total infrastructure score
-        attributes.append(self.total_infra_score)
-        
-        # Add census data and scores
+        attributes[pos] = self.total_infra_score
+        pos += 1
+
+        # Add census data and scores; census_data only holds raw values now,
+        # so each entry pairs directly with its normalized score
         for var_name, value in self.census_data.items():
-            if not var_name.endswith('_score'):  # Only add raw census values
-                attributes.append(value)
-                score = self.census_scores.get(var_name, 0)
-                attributes.append(score)
-        
-        # Calculate total census (demographic) score
-        total_census = self.calculate_total_census_score()
-        
+            attributes[pos] = value
+            attributes[pos + 1] = self.census_scores.get(var_name, 0)
+            pos += 2
+
         # Add critical zone scores
-        for zone_name, score in self.critical_zones.items():
-            attributes.append(score)
-        
-        # Add total zone score
-        attributes.append(self.total_zone_score)
-        
-        # Add total census (demographic) score
-        attributes.append(total_census)
-        
-        # Add final score
-        attributes.append(self.final_score)
-        
+        for score in self.critical_zones.values():
+            attributes[pos] = score
+            pos += 1
+
+        # Add total zone score, total census (demographic) score and final score
+        attributes[pos] = self.total_zone_score
+        attributes[pos + 1] = self.calculate_total_census_score()
+        attributes[pos + 2] = self.final_score
+
         return attributes
         
     def set_census_data(self, variable_name, value):
@@ -287,10 +256,7 @@ class Candidate:
         Returns:
             float: Total census score component
         """
-        if self.census_scores:
-            self.total_census_score = sum(self.census_scores.values())
-        else:
-            self.total_census_score = 0
+        # The total is maintained incrementally by set_census_data_score
         return self.total_census_score
         
     def get_census_data(self, variable_name):
@@ -328,11 +294,21 @@ class Candidate:
             infra_name: Name of the infrastructure type
             total_duration: Total travel duration in seconds
         """
-        if infra_name not in self.infrastructures:
-            self.infrastructures[infra_name] = {
-                'count': 0,
-                'raw_score': 0,
-                'final_score': 0,
-                'total_duration': 0
-            }
-        self.infrastructures[infra_name]['total_duration'] = total_duration
+        self.infra_duration[infra_name] = total_duration
+
+    @property
+    def infrastructures(self):
+        """
+        Nested dict view of the parallel infrastructure dicts.
+
+        Kept for callers that still expect the old dict-of-dicts shape;
+        hot paths should read the parallel dicts directly.
+
+        Returns:
+            dict: {infra_name: {count, raw_score, final_score, total_duration}}
+        """
+        return {name: {'count': self.infra_count.get(name, 0),
+                       'raw_score': self.infra_raw.get(name, 0),
+                       'final_score': self.infra_final.get(name, 0),
+                       'total_duration': self.infra_duration.get(name, 0)}
+                for name in self.infra_count}
@@ -4,10 +4,14 @@ for evaluating potential sites for mobile energy storage facilities as described
 methodology section 3.3 (Mobile Energy Storage System Model).
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
 from qgis.core import (QgsProcessingException, QgsFeature, QgsFields, QgsField,
                       QgsWkbTypes, QgsFeatureSink, QgsPointXY, QgsProject,
                       QgsCoordinateTransform, QgsCoordinateReferenceSystem,
-                      QgsGeometry, QgsRectangle)
+                      QgsGeometry, QgsRectangle, QgsFeatureRequest, QgsSpatialIndex)
 from qgis.PyQt.QtCore import QVariant
 from .road_network_analyzer import RoadNetworkAnalyzer
 from .mobile_candidate import Candidate as MobileCandidate
@@ -22,7 +26,11 @@ class MobileEnergyStorageEvaluator:
         """
         self.feedback = feedback
         self.road_analyzer = RoadNetworkAnalyzer()
-        
+        # Per-candidate detail logs format f-strings and cross the Qt signal
+        # boundary thousands of times per run; only emit them when the
+        # feedback asks for verbose output, matching the candidate classes
+        self.verbose = feedback is not None and getattr(feedback, 'isVerbose', lambda: False)()
+
     def log(self, message):
         """Log a message if feedback is available."""
         if self.feedback:
@@ -67,16 +75,16 @@ class MobileEnergyStorageEvaluator:
                 f"does not match number of census variables ({census_count})"
             )
 
-        # All weights must sum to 1.0
-        total_sum = sum(infra_weights) + sum(census_weights)
-        if not 0.999 <= total_sum <= 1.001:
+        # All weights must sum to 1.0; the total is computed once and reused
+        # for the exact-normalization step below
+        weight_sum = sum(infra_weights) + sum(census_weights)
+        if not 0.999 <= weight_sum <= 1.001:
             raise QgsProcessingException(
-                f"Total of all weights ({total_sum}) must equal 1.0. "
+                f"Total of all weights ({weight_sum}) must equal 1.0. "
                 "This includes both infrastructure and census weights."
             )
 
         # Normalize weights to exactly 1.0 if needed
-        weight_sum = sum(infra_weights) + sum(census_weights)
         if weight_sum != 1.0:
             factor = 1.0 / weight_sum
             infra_weights = [w * factor for w in infra_weights]
@@ -84,35 +92,49 @@ class MobileEnergyStorageEvaluator:
 
         return infra_weights, census_weights
 
-    def evaluate_critical_zones(self, candidates, zone_layers, zone_scores):
+    def evaluate_critical_zones(self, candidates, zone_layers, zone_scores, spatial_cache=None):
         """
         Evaluate candidates against critical zones and apply scores.
-        
+
         As described in section 3.3.4.2.2, critical zone scores follow the same
         approach as the static model. They are direct modifiers to the final score
         and not part of the weighted system.
-        
+
         Args:
             candidates: List of Candidate objects
             zone_layers: List of zone layers
             zone_scores: List of scores corresponding to zone layers
+            spatial_cache: Optional dict of layer id -> (QgsSpatialIndex,
+                {feature id: feature}, coords). With an index, a candidate
+                point only tests the zone polygons whose bounding boxes
+                contain it instead of scanning the whole layer
         """
-        for candidate in candidates:
-            candidate_id = candidate.feature.id() if hasattr(candidate.feature, 'id') else 'unknown'
-            self.log(f"Evaluating critical zones for candidate {candidate_id}")
-            
-            for i, zone_layer in enumerate(zone_layers):
-                zone_name = zone_layer.name()
-                zone_score = zone_scores[i]
-                
-                for zone_feature in zone_layer.getFeatures():
-                    if zone_feature.geometry().intersects(candidate.feature.geometry()):
-                        # Apply the zone score as a direct modifier
-                        candidate.set_critical_zone_score(zone_name, zone_score)
-                        self.log(f"Candidate intersects with {zone_name}, applying score: {zone_score}")
-                        break
-                    else:
-                        candidate.set_critical_zone_score(zone_name, 0)
+        for i, zone_layer in enumerate(zone_layers):
+            zone_name = zone_layer.name()
+            zone_score = zone_scores[i]
+            self.log(f"Evaluating critical zone layer {zone_name}")
+
+            snapshot = spatial_cache.get(zone_layer.id()) if spatial_cache else None
+            if snapshot is not None:
+                index, feature_map = snapshot[0], snapshot[1]
+            else:
+                # Read the layer once and build a local index so every
+                # candidate still pays only a bounding-box probe instead of
+                # testing each zone polygon
+                feature_map = {feature.id(): feature
+                               for feature in zone_layer.getFeatures(
+                                   QgsFeatureRequest().setNoAttributes())}
+                index = QgsSpatialIndex()
+                for feature in feature_map.values():
+                    index.addFeature(feature)
+
+            for candidate in candidates:
+                geom = candidate.feature.geometry()
+                hits = (feature_map[fid] for fid in index.intersects(geom.boundingBox()))
+                intersecting = any(zone_feature.geometry().intersects(geom)
+                                   for zone_feature in hits)
+                # Apply the zone score as a direct modifier
+                candidate.set_critical_zone_score(zone_name, zone_score if intersecting else 0)
 
     def evaluate_infrastructure(self, candidate, infra_layers, infra_weights, coverage_area):
         """
@@ -132,61 +154,83 @@ class MobileEnergyStorageEvaluator:
             coverage_area: QgsGeometry representing the shared coverage area
         """
         try:
+            # The candidate endpoint is the same for every pair
+            start_point = candidate.feature.geometry().asPoint()
+            start_lon, start_lat = self.road_analyzer.transform_coordinates(
+                start_point.x(), start_point.y()
+            )
+
+            # Same prepared-coverage probe as the batch path
+            coverage_engine = QgsGeometry.createGeometryEngine(coverage_area.constGet())
+            coverage_engine.prepareGeometry()
+
             for i, layer in enumerate(infra_layers):
                 infra_name = layer.name()
-                total_score = 0
-                total_duration = 0
-                infra_count = 0
-                invalid_count = 0
-                
-                self.log(f"\nEvaluating {infra_name} for candidate {candidate.id}:")
-                
-                for feature in layer.getFeatures():
+
+                if self.verbose:
+                    self.log(f"\nEvaluating {infra_name} for candidate {candidate.id}:")
+
+                # Collect the in-coverage endpoints first (section 3.3.2.2),
+                # then ask OSRM for the whole one-to-many duration row in a
+                # single /table request; per-pair /route calls remain only
+                # as the fallback when the table endpoint is unavailable
+                tasks = []
+                coverage_request = (QgsFeatureRequest()
+                                    .setFilterRect(coverage_area.boundingBox())
+                                    .setNoAttributes())
+                for feature in layer.getFeatures(coverage_request):
                     try:
-                        # Only consider infrastructure within the coverage area
-                        # This implements the coverage area concept from section 3.3.2.2
-                        if feature.geometry().intersects(coverage_area):
-                            infra_count += 1
-                            start_point = candidate.feature.geometry().asPoint()
+                        if coverage_engine.intersects(feature.geometry().constGet()):
                             end_point = feature.geometry().asPoint()
-                            
-                            # Transform coordinates for OSRM
-                            start_lon, start_lat = self.road_analyzer.transform_coordinates(
-                                start_point.x(), start_point.y()
-                            )
-                            end_lon, end_lat = self.road_analyzer.transform_coordinates(
+                            tasks.append(self.road_analyzer.transform_coordinates(
                                 end_point.x(), end_point.y()
-                            )
-                            
-                            # Get duration in seconds with additional validation
-                            # This implements the ETA calculation from section 3.3.2.1
-                            try:
-                                duration = self.road_analyzer.calculate_eta(
-                                    start_lon, start_lat, end_lon, end_lat
-                                )
-                                
-                                if duration is not None and duration > 0:
-                                    total_duration += duration
-                                    # Store the raw duration as the score - we'll invert during normalization
-                                    # to ensure that shorter travel times result in higher scores
-                                    total_score += duration
-                                    
-                                    self.log(f"Infrastructure {infra_count}: duration = {duration:.2f}s")
-                                else:
-                                    invalid_count += 1
-                                    self.log(f"Infrastructure {infra_count}: Invalid duration received, skipping")
-                                    continue
-                                    
-                            except Exception as e:
-                                invalid_count += 1
-                                self.log(f"Error calculating ETA for infrastructure {infra_count}: {str(e)}")
-                                continue
-                                
+                            ))
                     except Exception as e:
-                        invalid_count += 1
-                        self.log(f"Error processing infrastructure {infra_count}: {str(e)}")
+                        self.log(f"Error processing infrastructure feature: {str(e)}")
                         continue
-                
+
+                def fetch_eta(end_coords):
+                    # Implements the ETA calculation from section 3.3.2.1
+                    try:
+                        return self.road_analyzer.calculate_eta(
+                            start_lon, start_lat, end_coords[0], end_coords[1]
+                        )
+                    except Exception as e:
+                        self.log(f"Error calculating ETA: {str(e)}")
+                        return None
+
+                infra_count = len(tasks)
+                durations = None
+                if len(tasks) > 1:
+                    try:
+                        durations = self.road_analyzer.durations_from_one(
+                            (start_lon, start_lat), tasks)
+                    except Exception as e:
+                        self.log(f"Table request failed ({str(e)}); "
+                                 "falling back to per-pair routing")
+                if durations is None:
+                    # Per-pair fallback: fan the blocking ETA requests out to
+                    # a thread pool - the work is pure network I/O against
+                    # OSRM, so threads keep many requests in flight over the
+                    # pooled connections
+                    if len(tasks) > 1:
+                        with ThreadPoolExecutor(max_workers=min(32, len(tasks))) as pool:
+                            durations = list(pool.map(fetch_eta, tasks))
+                    else:
+                        durations = [fetch_eta(end_coords) for end_coords in tasks]
+
+                total_score = 0
+                total_duration = 0
+                invalid_count = 0
+                for duration in durations:
+                    if duration is not None and duration > 0:
+                        total_duration += duration
+                        # Store the raw duration as the score - we'll invert during normalization
+                        # to ensure that shorter travel times result in higher scores
+                        total_score += duration
+                    else:
+                        invalid_count += 1
+
                 # Only update scores if we have valid results
                 if infra_count > invalid_count:
                     # Update candidate scores
@@ -194,11 +238,12 @@ class MobileEnergyStorageEvaluator:
                     # Store total duration as the raw score
                     candidate.set_infrastructure_raw_score(infra_name, total_score)
                     candidate.set_infrastructure_total_duration(infra_name, total_duration)
-                    
-                    self.log(f"\nSummary for {infra_name}:")
-                    self.log(f"Total valid infrastructures: {infra_count - invalid_count}")
-                    self.log(f"Invalid/skipped infrastructures: {invalid_count}")
-                    self.log(f"Total duration: {total_duration:.2f}s")
+
+                    if self.verbose:
+                        self.log(f"\nSummary for {infra_name}:")
+                        self.log(f"Total valid infrastructures: {infra_count - invalid_count}")
+                        self.log(f"Invalid/skipped infrastructures: {invalid_count}")
+                        self.log(f"Total duration: {total_duration:.2f}s")
                 else:
                     self.log(f"\nWarning: No valid results for {infra_name}, skipping infrastructure type")
                     candidate.update_infrastructure_count(infra_name, 0)
@@ -209,6 +254,101 @@ class MobileEnergyStorageEvaluator:
             self.log(f"Error in evaluate_infrastructure: {str(e)}")
             raise
 
+    def evaluate_infrastructure_batch(self, candidates, infra_layers, infra_weights, coverage_area):
+        """
+        Evaluate all candidates against infrastructure layers in one pass.
+
+        Travel times come from a single OSRM /table request per layer
+        instead of one /route round-trip per candidate-infrastructure pair:
+        the table endpoint returns the whole duration matrix, so the HTTP
+        latency that dominated the per-pair calls is paid once per layer
+        (section 3.3.2.1). evaluate_infrastructure stays available as the
+        per-candidate fallback when the table endpoint is unavailable.
+
+        Args:
+            candidates: List of Candidate objects to evaluate
+            infra_layers: List of infrastructure layers
+            infra_weights: List of weights for each infrastructure layer
+            coverage_area: QgsGeometry representing the shared coverage area
+        """
+        if not candidates:
+            return
+
+        # Transform every candidate point to WGS 84 in one batch; the
+        # matrix calls below reuse them for all layers
+        sources = self.road_analyzer.transform_coordinates_batch(
+            [(point.x(), point.y()) for point in
+             (candidate.feature.geometry().asPoint() for candidate in candidates)]
+        )
+
+        # Prepare the coverage polygon once; every containment probe below
+        # then runs against the same prepared GEOS structure instead of
+        # re-deriving it per feature
+        coverage_engine = QgsGeometry.createGeometryEngine(coverage_area.constGet())
+        coverage_engine.prepareGeometry()
+
+        for i, layer in enumerate(infra_layers):
+            infra_name = layer.name()
+            self.log(f"\nEvaluating {infra_name} for {len(candidates)} candidates")
+
+            # Only infrastructure within the coverage area participates
+            # (section 3.3.2.2). The provider-side bounding-box filter
+            # shortlists features before the exact intersects test, so the
+            # full layer is never materialized when the coverage area is
+            # a small fraction of it
+            coverage_request = (QgsFeatureRequest()
+                                .setFilterRect(coverage_area.boundingBox())
+                                .setNoAttributes())
+            in_coverage = [feature for feature in layer.getFeatures(coverage_request)
+                           if coverage_engine.intersects(feature.geometry().constGet())]
+            if not in_coverage:
+                self.log(f"Warning: no {infra_name} features inside the coverage area")
+                for candidate in candidates:
+                    candidate.update_infrastructure_count(infra_name, 0)
+                    candidate.set_infrastructure_raw_score(infra_name, float('inf'))
+                    candidate.set_infrastructure_total_duration(infra_name, 0)
+                continue
+
+            destinations = self.road_analyzer.transform_coordinates_batch(
+                [(point.x(), point.y()) for point in
+                 (feature.geometry().asPoint() for feature in in_coverage)]
+            )
+
+            try:
+                durations = self.road_analyzer.calculate_eta_table(sources, destinations)
+            except Exception as e:
+                self.log(f"Table request failed for {infra_name} ({str(e)}); "
+                         "falling back to per-pair routing")
+                for candidate in candidates:
+                    self.evaluate_infrastructure(candidate, [layer], [infra_weights[i]], coverage_area)
+                continue
+
+            # Fold the numeric matrix into per-candidate scores; no HTTP
+            # happens inside this loop
+            for candidate, row in zip(candidates, durations):
+                total_duration = 0.0
+                invalid_count = 0
+                for duration in row:
+                    if duration is not None and duration > 0:
+                        total_duration += duration
+                    else:
+                        invalid_count += 1
+
+                if len(row) > invalid_count:
+                    candidate.update_infrastructure_count(infra_name, len(row) - invalid_count)
+                    # Store total duration as the raw score - it is inverted
+                    # during normalization so shorter travel wins
+                    candidate.set_infrastructure_raw_score(infra_name, total_duration)
+                    candidate.set_infrastructure_total_duration(infra_name, total_duration)
+                else:
+                    self.log(f"Warning: no valid durations for candidate {candidate.id} on {infra_name}")
+                    candidate.update_infrastructure_count(infra_name, 0)
+                    candidate.set_infrastructure_raw_score(infra_name, float('inf'))
+                    candidate.set_infrastructure_total_duration(infra_name, 0)
+
+            self.log(f"Summary for {infra_name}: {len(in_coverage)} infrastructures in coverage, "
+                     f"one table request for {len(candidates)} candidates")
+
     def normalize_and_weight_scores(self, candidates, infra_layers, census_vars, infra_weights, census_weights):
         """
         Normalize and apply weights to infrastructure and census scores.
@@ -232,90 +372,72 @@ class MobileEnergyStorageEvaluator:
             census_weights: List of weights for census variables
         """
         try:
-            # Find global min/max for infrastructure scores (these are durations)
-            global_infra_min = float('inf')
-            global_infra_max = float('-inf')
-            
-            for candidate in candidates:
-                for layer in infra_layers:
-                    infra_name = layer.name()
-                    duration = candidate.infrastructures.get(infra_name, {}).get('raw_score', float('inf'))
-                    if duration != float('inf'):  # Only include valid durations
-                        global_infra_min = min(global_infra_min, duration)
-                        global_infra_max = max(global_infra_max, duration)
-            
-            # Find global min/max for census values
-            census_ranges = {var: {'min': float('inf'), 'max': float('-inf')} 
-                            for var in census_vars}
-            
-            for candidate in candidates:
-                for var in census_vars:
-                    value = candidate.census_data.get(var, 0)
-                    census_ranges[var]['min'] = min(census_ranges[var]['min'], value)
-                    census_ranges[var]['max'] = max(census_ranges[var]['max'], value)
-            
-            # Apply normalization and weights
-            for candidate in candidates:
-                # Infrastructure scores
-                total_infra_score = 0
-                for i, layer in enumerate(infra_layers):
-                    infra_name = layer.name()
-                    duration = candidate.infrastructures.get(infra_name, {}).get('raw_score', float('inf'))
-                    
-                    # Normalize score - invert the normalization since lower duration is better
-                    # This implements the key difference in the mobile model scoring, where
-                    # shorter travel times mean higher scores
-                    if duration == float('inf'):
-                        normalized = 0
-                    elif global_infra_max == global_infra_min:
-                        # If all durations are the same, give them all a score of 1
-                        normalized = 1 if duration != float('inf') else 0
-                    else:
-                        # Invert the normalization: (max - duration) / (max - min)
-                        # This way, lowest duration gets highest score (1.0)
-                        normalized = (global_infra_max - duration) / (global_infra_max - global_infra_min)
-                        normalized = max(0, min(1, normalized))  # Ensure value is between 0 and 1
-                    
-                    # Apply weight: Sinfra-weighted = Sinfra-normalized × Winfra
-                    weighted_score = normalized * infra_weights[i]
-                    candidate.set_infrastructure_score(infra_name, weighted_score)
-                    total_infra_score += weighted_score
-                    
-                    self.log(f"\nInfrastructure {infra_name} for candidate {candidate.id}:")
-                    self.log(f"  Raw duration: {duration:.4f}s")
-                    self.log(f"  Normalized: {normalized:.4f}")
-                    self.log(f"  Weighted: {weighted_score:.4f}")
-                
-                candidate.total_infra_score = total_infra_score
-                
-                # Census scores - following same normalization approach as static model
-                # This is in line with section 3.3.4.2.2 which states demographic 
-                # considerations follow the same approach as the static model
-                total_census_score = 0
-                for i, var in enumerate(census_vars):
-                    value = candidate.census_data.get(var, 0)
-                    var_min = census_ranges[var]['min']
-                    var_max = census_ranges[var]['max']
-                    
-                    # Normalize score
-                    if var_max > var_min:
-                        normalized = (value - var_min) / (var_max - var_min)
-                    else:
-                        normalized = 1.0 if value > 0 else 0.0
-                    normalized = max(0, min(1, normalized))  # Ensure value is between 0 and 1
-                    
-                    # Apply weight
-                    weighted_score = normalized * census_weights[i]
-                    candidate.set_census_data_score(var, weighted_score)
-                    total_census_score += weighted_score
-                    
-                    self.log(f"\nCensus variable {var} for candidate {candidate.id}:")
-                    self.log(f"  Raw value: {value:.4f}")
-                    self.log(f"  Normalized: {normalized:.4f}")
-                    self.log(f"  Weighted: {weighted_score:.4f}")
-                
-                candidate.total_census_score = total_census_score
-            
+            if not candidates:
+                return
+
+            infra_names = [layer.name() for layer in infra_layers]
+
+            # Gather the raw values into (candidates x columns) matrices so
+            # normalization, clipping and weighting run as vectorized passes
+            # instead of per-cell Python arithmetic
+            durations = np.array(
+                [[candidate.infra_raw.get(name, np.inf) for name in infra_names]
+                 for candidate in candidates], dtype=np.float64)
+            census_values = np.array(
+                [[candidate.census_data.get(var, 0) for var in census_vars]
+                 for candidate in candidates], dtype=np.float64)
+
+            # Infrastructure: invert the global min-max normalization since
+            # lower durations are better - this is the key difference in the
+            # mobile model scoring (section 3.3.4.2.1)
+            valid = np.isfinite(durations)
+            if valid.any():
+                global_infra_min = durations[valid].min()
+                global_infra_max = durations[valid].max()
+            else:
+                global_infra_min = global_infra_max = 0.0
+
+            if global_infra_max > global_infra_min:
+                infra_norm = np.where(
+                    valid,
+                    (global_infra_max - durations) / (global_infra_max - global_infra_min),
+                    0.0)
+                infra_norm = np.clip(infra_norm, 0.0, 1.0)
+            else:
+                # If all durations are the same, give them all a score of 1
+                infra_norm = valid.astype(np.float64)
+
+            # Apply weight: Sinfra-weighted = Sinfra-normalized x Winfra
+            infra_weighted = infra_norm * np.asarray(infra_weights, dtype=np.float64)
+            infra_totals = infra_weighted.sum(axis=1)
+
+            # Census: per-variable min-max normalization, same approach as
+            # the static model (section 3.3.4.2.2)
+            var_min = census_values.min(axis=0) if census_vars else np.zeros(0)
+            var_max = census_values.max(axis=0) if census_vars else np.zeros(0)
+            span = var_max - var_min
+            safe_span = np.where(span > 0, span, 1.0)
+            census_norm = np.where(span > 0,
+                                   (census_values - var_min) / safe_span,
+                                   (census_values > 0).astype(np.float64))
+            census_norm = np.clip(census_norm, 0.0, 1.0)
+            census_weighted = census_norm * np.asarray(census_weights, dtype=np.float64)
+            census_totals = census_weighted.sum(axis=1)
+
+            # Scatter the weighted scores back onto the candidates
+            for i, candidate in enumerate(candidates):
+                for j, infra_name in enumerate(infra_names):
+                    candidate.set_infrastructure_score(infra_name, float(infra_weighted[i, j]))
+                candidate.total_infra_score = float(infra_totals[i])
+
+                for j, var in enumerate(census_vars):
+                    candidate.set_census_data_score(var, float(census_weighted[i, j]))
+                candidate.total_census_score = float(census_totals[i])
+
+                if self.verbose:
+                    self.log(f"Candidate {candidate.id}: infra score {candidate.total_infra_score:.4f}, "
+                             f"census score {candidate.total_census_score:.4f}")
+
         except Exception as e:
             self.log(f"Error in normalize_and_weight_scores: {str(e)}")
             raise
@@ -354,13 +476,14 @@ class MobileEnergyStorageEvaluator:
                     
                     # Store the final score
                     candidate.final_score = final_score
-                    
-                    # Log detailed scoring information
-                    self.log(f"\nCandidate {candidate.id}:")
-                    self.log(f"  Infrastructure score: {infra_score:.4f}")
-                    self.log(f"  Census/demographic score: {census_score:.4f}")
-                    self.log(f"  Critical zone total: {critical_zone_total:.4f}")
-                    self.log(f"  Final score: {final_score:.4f}")
+
+                    # Log detailed scoring information only in verbose runs
+                    if self.verbose:
+                        self.log(f"\nCandidate {candidate.id}:")
+                        self.log(f"  Infrastructure score: {infra_score:.4f}")
+                        self.log(f"  Census/demographic score: {census_score:.4f}")
+                        self.log(f"  Critical zone total: {critical_zone_total:.4f}")
+                        self.log(f"  Final score: {final_score:.4f}")
                     
                 except Exception as e:
                     self.log(f"Error calculating score for candidate {candidate.id}: {str(e)}")
@@ -1,38 +1,237 @@
+import os
+import sqlite3
+import threading
+
 import requests
 import numpy as np
+from functools import lru_cache
+from math import radians, sin, cos, sqrt, atan2
+
+# orjson parses the numeric-heavy OSRM payloads (notably /table duration
+# matrices) several times faster than the stdlib; fall back silently when
+# it is not installed
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    import json
+    _loads = json.loads
+from requests.adapters import HTTPAdapter
 from qgis.core import QgsCoordinateTransform, QgsProject, QgsPointXY, QgsCoordinateReferenceSystem
 
+# Shared keep-alive session: every OSRM call reuses a pooled TCP connection
+# instead of paying a fresh handshake per request, and the pool is wide
+# enough for threaded callers to keep requests in flight concurrently
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=64, pool_maxsize=64))
+
+
+# On-disk route cache shared across QGIS sessions: warm re-runs answer from
+# sqlite instead of OSRM. Failures here must never break routing, so every
+# database touch is wrapped defensively and disables the cache on error.
+_DB_LOCK = threading.Lock()
+_DB = None
+_DB_FAILED = False
+_DB_PATH = os.path.join(os.path.expanduser('~'), '.esle_route_cache.sqlite')
+# Bumped whenever the table keying changes; a mismatched user_version drops
+# the stale table so old rows can never satisfy lookups under the new key
+_DB_SCHEMA_VERSION = 2
+
+
+def _route_db():
+    global _DB, _DB_FAILED
+    if _DB is None and not _DB_FAILED:
+        try:
+            _DB = sqlite3.connect(_DB_PATH, isolation_level=None,
+                                  check_same_thread=False)
+            version = _DB.execute('PRAGMA user_version').fetchone()[0]
+            if version != _DB_SCHEMA_VERSION:
+                _DB.execute('DROP TABLE IF EXISTS routes')
+                _DB.execute(f'PRAGMA user_version = {_DB_SCHEMA_VERSION}')
+            # Routes are only valid against the OSRM instance that produced
+            # them (different port, profile or road-network import give
+            # different answers), so the base URL is part of the key
+            _DB.execute(
+                'CREATE TABLE IF NOT EXISTS routes('
+                'base_url TEXT, slon REAL, slat REAL, elon REAL, elat REAL, '
+                'distance REAL, duration REAL, '
+                'PRIMARY KEY(base_url, slon, slat, elon, elat))')
+        except Exception:
+            _DB = None
+            _DB_FAILED = True
+    return _DB
+
+
+@lru_cache(maxsize=200000)
+def _cached_route(base_url, start_lon, start_lat, end_lon, end_lat):
+    """
+    Fetch one OSRM route, memoized on the rounded endpoint coordinates.
+
+    Identical candidate/infrastructure pairs recur across layers and across
+    re-runs of the algorithm; serving them from the cache skips the HTTP
+    round-trip and the JSON parse. Module-level so the cache survives
+    analyzer instances within one QGIS session.
+
+    Returns:
+        tuple: (distance in meters, duration in seconds)
+    """
+    db = _route_db()
+    if db is not None:
+        try:
+            with _DB_LOCK:
+                row = db.execute(
+                    'SELECT distance, duration FROM routes '
+                    'WHERE base_url=? AND slon=? AND slat=? AND elon=? AND elat=?',
+                    (base_url, start_lon, start_lat, end_lon, end_lat)).fetchone()
+            if row is not None:
+                return row[0], row[1]
+        except Exception:
+            pass
+
+    location = f"{start_lon},{start_lat};{end_lon},{end_lat}"
+    # Only distance and duration are consumed, so skip the route geometry,
+    # alternatives and turn-by-turn steps: the response shrinks from the
+    # full polyline payload to a couple of numbers, cutting both OSRM
+    # serialization time and the json() parse here
+    r = _SESSION.get(
+        f"{base_url}/route/v1/driving/{location}",
+        params={'overview': 'false', 'alternatives': 'false', 'steps': 'false'}
+    )
+
+    if r.status_code != 200:
+        raise Exception(f"OSRM request failed with status code {r.status_code}")
+
+    res = _loads(r.content)
+    distance = res['routes'][0]['distance']
+    duration = res['routes'][0]['duration']
+
+    if db is not None:
+        try:
+            with _DB_LOCK:
+                db.execute(
+                    'INSERT OR REPLACE INTO routes VALUES(?,?,?,?,?,?,?)',
+                    (base_url, start_lon, start_lat, end_lon, end_lat,
+                     distance, duration))
+        except Exception:
+            pass
+
+    return distance, duration
+
+
 class RoadNetworkAnalyzer:
     def __init__(self, osrm_base_url="http://127.0.0.1:5001"):
         """
         Initializes the RoadNetworkAnalyzer with the URL of the OSRM instance.
         """
         self.osrm_base_url = osrm_base_url
+        # Project CRS -> WGS 84 transform, built lazily and rebuilt only if
+        # the project CRS changes; constructing it per point was the main
+        # Python-side cost of every coordinate conversion
+        self._transform = None
+        self._transform_src = None
+
+    def _coordinate_transform(self):
+        src = QgsProject.instance().crs()
+        if self._transform is None or src.authid() != self._transform_src:
+            dst = QgsCoordinateReferenceSystem('EPSG:4326')
+            self._transform = QgsCoordinateTransform(src, dst, QgsProject.instance())
+            self._transform_src = src.authid()
+        return self._transform
 
     def get_route_info(self, start_lon, start_lat, end_lon, end_lat):
         """
         Fetches route, distance in meters, and duration in seconds between two points
         using the road network from the OSRM instance.
+
+        Coordinates are quantized to 5 decimal places (~1 m) before the
+        cached lookup so near-identical points share a cache entry.
+        """
+        distance, duration = _cached_route(
+            self.osrm_base_url,
+            round(start_lon, 5), round(start_lat, 5),
+            round(end_lon, 5), round(end_lat, 5)
+        )
+        return {'distance': distance, 'duration': duration}
+
+    def calculate_eta_table(self, sources, destinations):
         """
-        location = f"{start_lon},{start_lat};{end_lon},{end_lat}"
-        r = requests.get(f"{self.osrm_base_url}/route/v1/driving/{location}")
+        Fetches the full duration matrix between sources and destinations
+        using a single OSRM /table request.
+
+        One table request replaces len(sources) * len(destinations) route
+        requests, so the HTTP round-trip cost is paid once instead of per
+        pair.
+
+        Args:
+            sources: List of (lon, lat) tuples in WGS 84
+            destinations: List of (lon, lat) tuples in WGS 84
+
+        Returns:
+            list: len(sources) x len(destinations) matrix of durations in
+            seconds; unreachable pairs come back as None
+        """
+        if not sources or not destinations:
+            return [[] for _ in sources]
+
+        coords = ";".join(f"{lon},{lat}" for lon, lat in list(sources) + list(destinations))
+        source_idx = ";".join(str(i) for i in range(len(sources)))
+        dest_idx = ";".join(str(i) for i in range(len(sources), len(sources) + len(destinations)))
+        r = _SESSION.get(
+            f"{self.osrm_base_url}/table/v1/driving/{coords}",
+            params={'sources': source_idx, 'destinations': dest_idx,
+                    'annotations': 'duration'}
+        )
 
         if r.status_code != 200:
-            raise Exception(f"OSRM request failed with status code {r.status_code}")
+            raise Exception(f"OSRM table request failed with status code {r.status_code}")
 
-        res = r.json()
-        distance = res['routes'][0]['distance']
-        duration = res['routes'][0]['duration']
+        return _loads(r.content)['durations']
 
-        return {'distance': distance, 'duration': duration}
+    def durations_from_one(self, source, destinations):
+        """
+        Fetch durations from a single source to many destinations.
+
+        OSRM answers the one-to-many /table query with a single Dijkstra
+        tree, so the whole row costs one HTTP round-trip instead of one
+        /route call per destination.
+
+        Args:
+            source: (lon, lat) tuple in WGS 84
+            destinations: List of (lon, lat) tuples in WGS 84
+
+        Returns:
+            list: Durations in seconds, one per destination; unreachable
+            destinations come back as None
+        """
+        table = self.calculate_eta_table([source], destinations)
+        return table[0] if table else []
 
     def transform_coordinates(self, x, y):
-        source_crs = QgsProject.instance().crs()  # Get the current project CRS
-        dest_crs = QgsCoordinateReferenceSystem('EPSG:4326')  # WGS 84
-        transform = QgsCoordinateTransform(source_crs, dest_crs, QgsProject.instance())
-        pt = transform.transform(QgsPointXY(x, y))
+        pt = self._coordinate_transform().transform(QgsPointXY(x, y))
         return pt.x(), pt.y()
 
+    def transform_coordinates_batch(self, points):
+        """
+        Transform an iterable of (x, y) points to WGS 84 in one sweep.
+
+        The transform is resolved once for the whole batch; identity
+        transforms (project already in WGS 84) skip the PROJ call entirely.
+
+        Args:
+            points: Iterable of (x, y) tuples in the project CRS
+
+        Returns:
+            list: (lon, lat) tuples in WGS 84
+        """
+        transform = self._coordinate_transform()
+        if transform.isShortCircuited():
+            return [(x, y) for x, y in points]
+        out = []
+        for x, y in points:
+            pt = transform.transform(QgsPointXY(x, y))
+            out.append((pt.x(), pt.y()))
+        return out
+
     def calculate_road_distance(self, start_x, start_y, end_x, end_y):
         """
         Calculates the road distance in meters between two points using OSRM.
@@ -64,15 +263,42 @@ class RoadNetworkAnalyzer:
 
     def haversine_distance(self, lon1, lat1, lon2, lat2):
         """
-        Calculate the great circle distance between two points 
+        Calculate the great circle distance between two points
         on the earth (specified in decimal degrees).
         Returns distance in kilometers.
+
+        Uses scalar math functions: every np.* call on a scalar allocates a
+        0-d ndarray, which made this per-pair hot path several times slower
+        than plain math. Use haversine_matrix for array inputs.
         """
         r = 6371  # Radius of Earth in kilometers
-        phi1 = np.radians(lat1)
-        phi2 = np.radians(lat2)
-        delta_phi = np.radians(lat2 - lat1)
-        delta_lambda = np.radians(lon2 - lon1)
-        a = np.sin(delta_phi / 2)**2 + np.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2)**2
-        res = r * (2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a)))
-        return np.round(res * 1000, 2)  # Convert to meters for consistency with road distance
+        phi1 = radians(lat1)
+        phi2 = radians(lat2)
+        delta_phi = radians(lat2 - lat1)
+        delta_lambda = radians(lon2 - lon1)
+        a = sin(delta_phi / 2)**2 + cos(phi1) * cos(phi2) * sin(delta_lambda / 2)**2
+        res = r * (2 * atan2(sqrt(a), sqrt(1 - a)))
+        return round(res * 1000, 2)  # Convert to meters for consistency with road distance
+
+    def haversine_matrix(self, lons1, lats1, lons2, lats2):
+        """
+        Great-circle distances between every pair of two point sets.
+
+        Broadcasts the haversine formula over an N x M grid in one
+        vectorized pass; useful as a cheap pre-filter before issuing road
+        routing requests.
+
+        Args:
+            lons1, lats1: 1-D arrays of the first point set (decimal degrees)
+            lons2, lats2: 1-D arrays of the second point set
+
+        Returns:
+            numpy.ndarray: N x M matrix of distances in meters
+        """
+        phi1 = np.radians(np.asarray(lats1, dtype=np.float64))[:, None]
+        phi2 = np.radians(np.asarray(lats2, dtype=np.float64))[None, :]
+        lam1 = np.radians(np.asarray(lons1, dtype=np.float64))[:, None]
+        lam2 = np.radians(np.asarray(lons2, dtype=np.float64))[None, :]
+        a = (np.sin((phi2 - phi1) / 2)**2
+             + np.cos(phi1) * np.cos(phi2) * np.sin((lam2 - lam1) / 2)**2)
+        return 6371000.0 * (2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a)))
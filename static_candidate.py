@@ -4,59 +4,432 @@ It represents a potential location for energy storage system deployment with all
 attributes and scoring mechanisms as described in methodology section 3.2.
 """
 
-from qgis.core import QgsGeometry, QgsProject, QgsCoordinateReferenceSystem, QgsCoordinateTransform
+import numpy as np
+
+from qgis.core import (QgsGeometry, QgsProject, QgsCoordinateReferenceSystem,
+                       QgsCoordinateTransform, QgsPointXY, QgsWkbTypes)
+
+# Shared name -> array-index mappings. Every candidate stores its scores in
+# small numpy arrays indexed through these maps, so the names are kept once per
+# process instead of once per candidate, and aggregations reduce contiguous
+# float arrays instead of chasing nested dicts.
+INFRA_INDEX = {}
+CENSUS_INDEX = {}
+ZONE_INDEX = {}
+
+
+def _configure_index(index_map, names):
+    """Rebuild a shared name->index map from an ordered list of names."""
+    index_map.clear()
+    for name in names:
+        index_map[name] = len(index_map)
+
+
+def configure_infrastructure_index(infra_names):
+    """
+    Register the infrastructure types for the current evaluation run.
+
+    Must be called before candidates are built so their score arrays are
+    preallocated with one slot per infrastructure layer, in layer order.
+
+    Args:
+        infra_names: Iterable of infrastructure layer names
+    """
+    _configure_index(INFRA_INDEX, infra_names)
+
+
+def configure_census_index(census_variables):
+    """
+    Register the census variables for the current evaluation run.
+
+    Args:
+        census_variables: Iterable of census variable names
+    """
+    _configure_index(CENSUS_INDEX, census_variables)
+
+
+def configure_zone_index(zone_names):
+    """
+    Register the critical zone layers for the current evaluation run.
+
+    Args:
+        zone_names: Iterable of critical zone layer names
+    """
+    _configure_index(ZONE_INDEX, zone_names)
+
 
 class Candidate:
-    def __init__(self, feature, buffer_distance, feedback=None):
+    # Fixed attribute layout: thousands of candidates exist at once, and a
+    # slotted instance skips the per-object __dict__ allocation
+    __slots__ = ('feature', 'feedback', 'verbose', 'id', 'field_id',
+                 'field_name', 'point_xy', 'buffer', 'buffer_bbox',
+                 'buffer_is_valid',
+                 'infra_count', 'infra_raw', 'infra_norm', 'infra_weighted',
+                 'census_raw_arr', 'census_score_arr', 'zone_score_arr',
+                 'final_score', 'total_census_score', 'total_infra_score',
+                 'total_zone_score', 'outage_totals',
+                 'total_outage_cost_savings', '_buffer_engine',
+                 '_final_dirty')
+
+    # Class-level CRS/transform cache shared by all candidates. Building
+    # QgsCoordinateReferenceSystem and QgsCoordinateTransform objects triggers
+    # PROJ pipeline initialization, which is expensive compared to the actual
+    # geometric work, so we pay that cost once instead of once per candidate.
+    _utm_crs = None
+    _wgs_crs = None
+    _to_utm = None
+    _to_wgs = None
+
+    # Layer-level validity cache: when a layer has been prevalidated, only the
+    # features recorded as invalid pay for makeValid; everything else skips the
+    # per-feature GEOS topology check entirely.
+    _layer_validated = False
+    _invalid_fids = frozenset()
+
+    @classmethod
+    def prevalidate_layer(cls, features, feedback=None):
+        """
+        Check geometry validity for a whole layer in one pass.
+
+        Records the set of invalid feature ids so that create_buffer and
+        build_many can skip the per-feature isGeosValid call for layers that
+        are known to be clean.
+
+        Args:
+            features: Iterable of QgsFeature objects to check
+            feedback: Optional feedback mechanism for logging
+
+        Returns:
+            list: The materialized feature list (so callers can reuse it)
+        """
+        features = list(features)
+        invalid = {feature.id() for feature in features
+                   if not feature.geometry().isGeosValid()}
+        cls._invalid_fids = frozenset(invalid)
+        cls._layer_validated = True
+
+        if feedback and invalid:
+            feedback.pushInfo(f"Found {len(invalid)} invalid geometries to repair")
+
+        return features
+
+    @staticmethod
+    def _projected_authid(lon, lat):
+        """
+        Pick a metric CRS for buffering around the given geographic location.
+
+        Puerto Rico data keeps the State Plane zone the plugin was designed
+        around; anywhere else falls back to the standard UTM zone for the
+        longitude, so buffers stay circular instead of inheriting the
+        distortion of a far-away projection.
+
+        Args:
+            lon, lat: Location in decimal degrees
+
+        Returns:
+            str: Authority id of the projected CRS (e.g. 'EPSG:32161')
+        """
+        if -68.0 <= lon <= -64.5 and 17.0 <= lat <= 19.5:
+            return 'EPSG:32161'  # Puerto Rico State Plane (meters)
+        zone = min(60, max(1, int((lon + 180.0) / 6.0) + 1))
+        return f'EPSG:{(32600 if lat >= 0 else 32700) + zone}'
+
+    @classmethod
+    def _ensure_transforms(cls, source_crs=None, hint_point=None):
+        """
+        Lazily build the shared source<->projected transforms.
+
+        Args:
+            source_crs: CRS of the candidate layer. Defaults to WGS84 when not
+                given. If the layer is already in the projected CRS the
+                resulting transforms are short-circuited and the buffer path
+                skips them.
+            hint_point: Optional (lon, lat) of one candidate, used to select
+                the projected CRS when the source CRS is geographic. Without
+                it (or for projected sources) Puerto Rico State Plane is
+                assumed, matching the plugin's home region.
+        """
+        if (source_crs is not None and cls._wgs_crs is not None
+                and source_crs.authid() != cls._wgs_crs.authid()):
+            # Cached transforms were built for a different source CRS
+            cls.reset_transform_cache()
+
+        projected = 'EPSG:32161'
+        if (hint_point is not None and source_crs is not None
+                and source_crs.isGeographic()):
+            # Re-derive the projected CRS from the hint on every call: a
+            # later run in the same QGIS session can cover a different study
+            # area with the same geographic source CRS, and reusing the
+            # previous region's projection would reintroduce the distortion
+            # the location-based selection exists to avoid
+            projected = cls._projected_authid(hint_point[0], hint_point[1])
+            if cls._utm_crs is not None and cls._utm_crs.authid() != projected:
+                cls.reset_transform_cache()
+
+        if cls._to_utm is None:
+            cls._utm_crs = QgsCoordinateReferenceSystem(projected)
+            if source_crs is not None:
+                cls._wgs_crs = source_crs
+            else:
+                cls._wgs_crs = QgsCoordinateReferenceSystem('EPSG:4326')   # WGS84
+            cls._to_utm = QgsCoordinateTransform(cls._wgs_crs, cls._utm_crs, QgsProject.instance())
+            cls._to_wgs = QgsCoordinateTransform(cls._utm_crs, cls._wgs_crs, QgsProject.instance())
+
+    @classmethod
+    def reset_transform_cache(cls):
+        """Clear the cached transforms (e.g. when the project CRS context changes)."""
+        cls._utm_crs = None
+        cls._wgs_crs = None
+        cls._to_utm = None
+        cls._to_wgs = None
+
+    @classmethod
+    def build_many(cls, features, buffer_distance, feedback=None, source_crs=None, segments=12):
+        """
+        Build candidates for all features in one batch.
+
+        Calling create_buffer once per feature repeats the transform setup and
+        per-candidate logging N times. This batch path builds the shared
+        transform pair once, then runs the transform/buffer/transform sweep
+        over all features in a single pass, logging one summary at the end.
+        create_buffer remains available as the single-feature fallback.
+
+        The sweep is intentionally serial: QGIS geometry objects cannot be
+        pickled into worker processes, and once the transform pair is shared
+        the per-feature work is too small to amortize process start-up.
+
+        Args:
+            features: Iterable of QgsFeature candidate locations
+            buffer_distance: Buffer radius in meters (section 3.2.2.2)
+            feedback: Optional feedback mechanism for logging
+            source_crs: CRS of the candidate layer (defaults to WGS84)
+
+        Returns:
+            list: Candidate objects with their buffers assigned
+        """
+        # One validity sweep up front; the buffer loop then only repairs the
+        # features that were recorded as invalid
+        features = cls.prevalidate_layer(features, feedback)
+
+        # One candidate location is enough to pick the right metric CRS for
+        # the whole batch (all candidates share a study area)
+        hint_point = None
+        if features:
+            center = features[0].geometry().boundingBox().center()
+            hint_point = (center.x(), center.y())
+        cls._ensure_transforms(source_crs, hint_point=hint_point)
+
+        # When the layer is already in the metric CRS, both transforms are
+        # identities and the double PROJ round-trip can be skipped entirely
+        needs_transform = not cls._to_utm.isShortCircuited()
+
+        # Construction and buffering are guarded per feature: one bad
+        # geometry (e.g. a QgsCsException from an out-of-range coordinate)
+        # skips that candidate instead of aborting the whole batch
+        candidates = []
+        for feature in features:
+            try:
+                candidates.append(cls(feature, None, feedback))
+            except Exception as e:
+                if feedback:
+                    feedback.reportError(
+                        f"Error initializing candidate {feature.id()}: {str(e)}")
+
+        # Fast path for point candidates: buffering a point is just a circle,
+        # so the ring offsets are computed once with numpy and shifted onto
+        # each center instead of invoking the general GEOS buffer per feature
+        angles = np.linspace(0.0, 2.0 * np.pi, 4 * segments, endpoint=False)
+        circle_offsets = np.column_stack((np.cos(angles), np.sin(angles))) * buffer_distance
+
+        built = []
+        for candidate in candidates:
+            try:
+                # point_xy was cached at construction; a miss means the
+                # feature is not a simple point and takes the general buffer
+                # path below
+                if candidate.point_xy is not None and candidate.id not in cls._invalid_fids:
+                    if needs_transform:
+                        point = cls._to_utm.transform(QgsPointXY(*candidate.point_xy))
+                        center = (point.x(), point.y())
+                    else:
+                        center = candidate.point_xy
+                    ring = circle_offsets + center
+                    buffer_geom = QgsGeometry.fromPolygonXY(
+                        [[QgsPointXY(px, py) for px, py in ring]])
+                else:
+                    # feature.geometry() returns a detached copy; transform in place
+                    geom = candidate.feature.geometry()
+                    if candidate.id in cls._invalid_fids:
+                        geom = geom.makeValid()
+                    if needs_transform:
+                        geom.transform(cls._to_utm)
+                    buffer_geom = geom.buffer(buffer_distance, segments=segments)
+
+                if needs_transform:
+                    buffer_geom.transform(cls._to_wgs)
+            except Exception as e:
+                if feedback:
+                    feedback.reportError(
+                        f"Skipping candidate {candidate.id}: buffer creation failed ({str(e)})")
+                continue
+            candidate.buffer = buffer_geom
+            candidate.buffer_bbox = buffer_geom.boundingBox()
+            # GEOS buffers (and the explicit circles above) are valid by
+            # construction; record that so the write loop can skip the
+            # per-candidate isGeosValid topology check
+            candidate.buffer_is_valid = True
+            built.append(candidate)
+
+        if feedback:
+            skipped = len(candidates) - len(built)
+            feedback.pushInfo(
+                f"Created buffers for {len(built)} candidates in one batch "
+                f"(distance {buffer_distance:.2f} meters"
+                + (f", {skipped} skipped" if skipped else "") + ")")
+
+        return built
+
+    def __init__(self, feature, buffer_distance, feedback=None, segments=12, buffer_geom=None):
         """
         Initialize the candidate with its feature and buffer.
-        
+
         As described in section 3.2.1.1, candidates represent geographical locations
         under consideration for the deployment of Energy Storage Systems (ESS).
-        
+
         Args:
             feature: QgsFeature representing the candidate location
-            buffer_distance: Distance in kilometers for buffer analysis (section 3.2.2.2)
+            buffer_distance: Distance in kilometers for buffer analysis (section 3.2.2.2).
+                When None, buffer creation is deferred to the caller (see build_many)
             feedback: Optional feedback mechanism for logging
+            segments: Quarter-circle segments for the buffer approximation
+            buffer_geom: Optional pre-built buffer geometry. When given, it is
+                adopted as-is and no per-candidate buffering runs here
         """
         self.feature = feature
         self.feedback = feedback
-        
+
+        # Per-candidate logging crosses the Python->QGIS C++ log boundary and
+        # formats strings on every call; with thousands of candidates that adds
+        # up, so the detailed logs only run when the feedback is verbose
+        self.verbose = feedback is not None and getattr(feedback, 'isVerbose', lambda: False)()
+
         # Store the ID immediately for consistent access
         self.id = feature.id()  # Use native feature ID
         
-        # Check all possible ID field variations
-        if 'Id' in feature.fields().names():
-            self.field_id = feature['Id']
-        elif 'ID' in feature.fields().names():
-            self.field_id = feature['ID']
-        elif 'id' in feature.fields().names():
-            self.field_id = feature['id']
-        else:
-            self.field_id = self.id
-            
+        # Check all possible ID field variations. lookupField is a hashed O(1)
+        # lookup, avoiding repeated materialization of the full field-name list
+        fields = feature.fields()
+        self.field_id = self.id
+        for id_name in ('Id', 'ID', 'id'):
+            idx = fields.lookupField(id_name)
+            if idx >= 0:
+                self.field_id = feature[idx]
+                break
+
+        # Resolve the display name once as well, so output generation never
+        # goes back through string-indexed attribute lookups
+        self.field_name = None
+        for name_field in ('Name', 'name', 'NAME'):
+            idx = fields.lookupField(name_field)
+            if idx >= 0:
+                self.field_name = str(feature[idx])
+                break
+        if not self.field_name:
+            self.field_name = f'Candidate {self.field_id}'
+
         # Log ID assignment for debugging
-        if self.feedback:
+        if self.verbose:
             self.feedback.pushInfo(f"Initializing candidate with ID: {self.id} (field ID: {self.field_id})")
-        
-        # Create buffer as the service area around the candidate (section 3.2.2.2)
-        self.buffer = self.create_buffer(buffer_distance)
-        
-        # Initialize data structures for scoring categories (section 3.2.4.2)
-        self.infrastructures = {}    # Critical Infrastructure proximity scores
-        self.census_data = {}        # Raw census data values
-        self.census_scores = {}      # Normalized and weighted census scores
-        self.critical_zones = {}     # Critical zone direct modifiers
+
+        # Extract the point coordinates once. Distance calculations and the
+        # batch buffer pass otherwise call geometry().asPoint() repeatedly,
+        # crossing into the C++ bindings for the same pair of floats each time
+        geom = feature.geometry()
+        if (QgsWkbTypes.geometryType(geom.wkbType()) == QgsWkbTypes.PointGeometry
+                and not geom.isMultipart()):
+            point = geom.asPoint()
+            self.point_xy = (point.x(), point.y())
+        else:
+            self.point_xy = None
+        
+        # Create buffer as the service area around the candidate (section 3.2.2.2).
+        # Pre-built geometries (from the build_many batch pass) are adopted
+        # directly; a None distance defers the buffer to the caller
+        if buffer_geom is not None:
+            self.buffer = buffer_geom
+        elif buffer_distance is not None:
+            self.buffer = self.create_buffer(buffer_distance, segments)
+        else:
+            self.buffer = None
+        # Validity is established once here (adopted geometries are checked,
+        # create_buffer output comes straight from GEOS) rather than per
+        # candidate in the output-write loop
+        if buffer_geom is not None:
+            self.buffer_is_valid = buffer_geom.isGeosValid()
+        else:
+            self.buffer_is_valid = self.buffer is not None
+        # The bounding box is the entry ticket for every spatial-index probe
+        # and provider-side filter downstream; compute it once here instead of
+        # per lookup
+        self.buffer_bbox = self.buffer.boundingBox() if self.buffer is not None else None
+        
+        # Initialize data structures for scoring categories (section 3.2.4.2).
+        # Infrastructure scores are stored as parallel numpy arrays indexed by
+        # the shared INFRA_INDEX (SoA layout); the `infrastructures` property
+        # exposes the familiar dict-of-dicts view for output generation.
+        k = len(INFRA_INDEX)
+        self.infra_count = np.zeros(k, dtype=np.int32)      # Items within buffer
+        self.infra_raw = np.zeros(k, dtype=np.float64)      # Raw proximity scores
+        self.infra_norm = np.zeros(k, dtype=np.float64)     # Normalized scores
+        self.infra_weighted = np.zeros(k, dtype=np.float64) # Weighted scores
+        # Census and zone scores use the same SoA layout through CENSUS_INDEX
+        # and ZONE_INDEX; dict views are exposed by the properties below
+        self.census_raw_arr = np.zeros(len(CENSUS_INDEX), dtype=np.float64)
+        self.census_score_arr = np.zeros(len(CENSUS_INDEX), dtype=np.float64)
+        self.zone_score_arr = np.zeros(len(ZONE_INDEX), dtype=np.float64)
         self.final_score = 0         # Final combined score
+        self._final_dirty = True     # Cleared once calculate_final_score runs
         self.total_census_score = 0  # Total census component
         self.total_infra_score = 0   # Total infrastructure component
         self.total_zone_score = 0    # Total zone modifiers
         
-        # Initialize outage cost tracking for economic analysis (section 3.2.4.3)
-        self.outage_costs = {}
+        # Initialize outage cost tracking for economic analysis (section 3.2.4.3).
+        # Individual costs are accumulated directly into per-type running totals
+        self.outage_totals = np.zeros(k, dtype=np.float64)
         self.total_outage_cost_savings = 0
+
+        # Prepared-geometry engine for the buffer, built lazily on first use
+        self._buffer_engine = None
+
+    def prepared_buffer(self):
+        """
+        Return a prepared geometry engine for the candidate's buffer.
+
+        The buffer is tested against many features (infrastructure, census
+        areas, zones). Preparing it once builds the GEOS edge index a single
+        time, making each subsequent intersects/contains probe roughly
+        logarithmic instead of a full geometry comparison.
+
+        Returns:
+            QgsGeometryEngine or None: Prepared engine, or None when the
+            candidate has no buffer yet
+        """
+        if self._buffer_engine is None and self.buffer is not None:
+            self._buffer_engine = QgsGeometry.createGeometryEngine(self.buffer.constGet())
+            self._buffer_engine.prepareGeometry()
+        return self._buffer_engine
+
+    def release_prepared_buffer(self):
+        """
+        Drop the prepared geometry engine.
+
+        Called once all spatial predicates for this candidate are done (e.g.
+        while streaming results to the output sink), so the prepared GEOS
+        structures do not linger for the rest of the run.
+        """
+        self._buffer_engine = None
         
-    def create_buffer(self, buffer_distance):
+    def create_buffer(self, buffer_distance, segments=12):
         """
         Create a circular buffer (service area) around the candidate location.
         
@@ -71,76 +444,193 @@ class Candidate:
             QgsGeometry: Buffer geometry in WGS84 coordinates
         """
         # Log buffer creation information
-        if self.feedback:
-            feature_id = self.feature['id'] if 'id' in self.feature.fields().names() else 'unknown'
+        if self.verbose:
             self.feedback.pushInfo(f"Creating buffer for candidate {self.field_id} with distance {buffer_distance:.2f} meters")
             
-        # Get the feature's geometry
+        # Get the feature's geometry. When the layer was prevalidated, only the
+        # known-invalid features pay for the repair; otherwise fall back to the
+        # per-feature topology check
         geom = self.feature.geometry()
-        
-        if not geom.isGeosValid():
-            if self.feedback:
+
+        if Candidate._layer_validated:
+            if self.id in Candidate._invalid_fids:
+                if self.verbose:
+                    self.feedback.pushInfo("Invalid input geometry, attempting to fix...")
+                geom = geom.makeValid()
+        elif not geom.isGeosValid():
+            if self.verbose:
                 self.feedback.pushInfo("Invalid input geometry, attempting to fix...")
             geom = geom.makeValid()
         
-        # Get centroid for UTM zone calculation
-        centroid = geom.centroid().asPoint()
-        
-        # Calculate UTM zone for the location (Puerto Rico is around -66° longitude)
-        # Puerto Rico falls in UTM zone 19N
-        utm_crs = QgsCoordinateReferenceSystem('EPSG:32161')  # Puerto Rico State Plane (meters)
-        
-        if self.feedback:
-            self.feedback.pushInfo(f"Using projected CRS: {utm_crs.description()}")
-        
-        # Create transform context
-        source_crs = QgsCoordinateReferenceSystem('EPSG:4326')  # WGS84
-        transform_to_utm = QgsCoordinateTransform(source_crs, utm_crs, QgsProject.instance())
-        transform_to_wgs84 = QgsCoordinateTransform(utm_crs, source_crs, QgsProject.instance())
-        
-        # Transform geometry to UTM
-        geom_utm = QgsGeometry(geom)
-        geom_utm.transform(transform_to_utm)
-        
-        if self.feedback:
+        # Puerto Rico falls in UTM zone 19N (around -66° longitude)
+        # Use the shared class-level transform pair (built once for all candidates)
+        Candidate._ensure_transforms()
+
+        if self.verbose:
+            self.feedback.pushInfo(f"Using projected CRS: {Candidate._utm_crs.description()}")
+
+        transform_to_utm = Candidate._to_utm
+        transform_to_wgs84 = Candidate._to_wgs
+        
+        # Transform geometry to UTM (skipped when the transform is an identity,
+        # i.e. the source data is already in the projected CRS).
+        # feature.geometry() already hands back a detached copy, so the
+        # transform can run in place without an extra QgsGeometry clone
+        geom_utm = geom
+        if not transform_to_utm.isShortCircuited():
+            geom_utm.transform(transform_to_utm)
+        
+        if self.verbose:
             self.feedback.pushInfo(f"Geometry area before buffer (UTM): {geom_utm.area():.2f} sq meters")
         
         # Create buffer in UTM coordinates (which are in meters)
-        buffer_geom = geom_utm.buffer(buffer_distance, segments=36)  # More segments for smoother buffer
+        # 12 segments per quarter circle keeps the area error under 1% while
+        # giving downstream intersection tests 3x fewer vertices than 36
+        buffer_geom = geom_utm.buffer(buffer_distance, segments=segments)
         
-        if self.feedback:
+        if self.verbose:
             self.feedback.pushInfo(f"Buffer area (UTM): {buffer_geom.area():.2f} sq meters")
         
-        # Transform buffer back to WGS84
-        buffer_geom.transform(transform_to_wgs84)
+        # Transform buffer back to WGS84 (identity transforms are skipped)
+        if not transform_to_wgs84.isShortCircuited():
+            buffer_geom.transform(transform_to_wgs84)
         
-        if self.feedback:
+        if self.verbose:
             self.feedback.pushInfo(f"Final buffer area (WGS84): {buffer_geom.area():.2f} sq meters")
             self.feedback.pushInfo(f"Buffer is valid: {buffer_geom.isGeosValid()}")
         
         return buffer_geom
         
+    def _infra_slot(self, infra_name):
+        """
+        Resolve an infrastructure name to its array index, growing the
+        per-candidate score arrays if the shared index gained new names
+        after this candidate was built.
+
+        Args:
+            infra_name: Name of the infrastructure type
+
+        Returns:
+            int: Index into the per-candidate score arrays
+        """
+        idx = INFRA_INDEX.get(infra_name)
+        if idx is None:
+            idx = len(INFRA_INDEX)
+            INFRA_INDEX[infra_name] = idx
+
+        if idx >= self.infra_raw.shape[0]:
+            grow = idx + 1 - self.infra_raw.shape[0]
+            self.infra_count = np.concatenate([self.infra_count, np.zeros(grow, dtype=np.int32)])
+            self.infra_raw = np.concatenate([self.infra_raw, np.zeros(grow, dtype=np.float64)])
+            self.infra_norm = np.concatenate([self.infra_norm, np.zeros(grow, dtype=np.float64)])
+            self.infra_weighted = np.concatenate([self.infra_weighted, np.zeros(grow, dtype=np.float64)])
+            self.outage_totals = np.concatenate([self.outage_totals, np.zeros(grow, dtype=np.float64)])
+
+        return idx
+
+    def _census_slot(self, variable_name):
+        """Resolve a census variable to its array index, growing arrays as needed."""
+        idx = CENSUS_INDEX.get(variable_name)
+        if idx is None:
+            idx = len(CENSUS_INDEX)
+            CENSUS_INDEX[variable_name] = idx
+
+        if idx >= self.census_raw_arr.shape[0]:
+            grow = idx + 1 - self.census_raw_arr.shape[0]
+            self.census_raw_arr = np.concatenate([self.census_raw_arr, np.zeros(grow, dtype=np.float64)])
+            self.census_score_arr = np.concatenate([self.census_score_arr, np.zeros(grow, dtype=np.float64)])
+
+        return idx
+
+    def _zone_slot(self, zone_name):
+        """Resolve a critical zone to its array index, growing arrays as needed."""
+        idx = ZONE_INDEX.get(zone_name)
+        if idx is None:
+            idx = len(ZONE_INDEX)
+            ZONE_INDEX[zone_name] = idx
+
+        if idx >= self.zone_score_arr.shape[0]:
+            grow = idx + 1 - self.zone_score_arr.shape[0]
+            self.zone_score_arr = np.concatenate([self.zone_score_arr, np.zeros(grow, dtype=np.float64)])
+
+        return idx
+
+    @property
+    def census_data(self):
+        """Dict view over the raw census values (scores live in census_scores)."""
+        return {name: float(self.census_raw_arr[idx])
+                for name, idx in CENSUS_INDEX.items()
+                if idx < self.census_raw_arr.shape[0]}
+
+    @property
+    def census_scores(self):
+        """Dict view over the weighted census scores."""
+        return {name: float(self.census_score_arr[idx])
+                for name, idx in CENSUS_INDEX.items()
+                if idx < self.census_score_arr.shape[0]}
+
+    @property
+    def critical_zones(self):
+        """Dict view over the critical zone modifiers."""
+        return {name: float(self.zone_score_arr[idx])
+                for name, idx in ZONE_INDEX.items()
+                if idx < self.zone_score_arr.shape[0]}
+
+    @property
+    def infrastructures(self):
+        """
+        Dict-of-dicts view over the per-infrastructure score arrays.
+
+        Kept for output generation and logging; hot paths should use the
+        numpy arrays (infra_count, infra_raw, infra_norm, infra_weighted)
+        directly.
+        """
+        view = {}
+        for name, idx in INFRA_INDEX.items():
+            if idx < self.infra_raw.shape[0]:
+                view[name] = {
+                    'count': int(self.infra_count[idx]),
+                    'raw_score': float(self.infra_raw[idx]),
+                    'normalized_score': float(self.infra_norm[idx]),
+                    'weighted_score': float(self.infra_weighted[idx]),
+                    'outage_cost_total': float(self.outage_totals[idx]),
+                }
+        return view
+
+    def apply_infra(self, infra_name, count, raw_score, outage_total=None):
+        """
+        Write the evaluation results for one infrastructure type in one call.
+
+        Fuses what used to be separate update_infrastructure_count /
+        set_infrastructure_raw_score passes into a single slot resolution and
+        contiguous array writes.
+
+        Args:
+            infra_name: Name of the infrastructure type
+            count: Number of infrastructure items found within the buffer
+            raw_score: The raw unweighted proximity score
+            outage_total: Optional total outage cost for this type
+        """
+        idx = self._infra_slot(infra_name)
+        self.infra_count[idx] = count
+        self.infra_raw[idx] = raw_score
+        if outage_total is not None:
+            self.outage_totals[idx] = outage_total
+
     def update_infrastructure_count(self, infra_name, count=0):
         """
         Update the count of infrastructure items of a given type.
-        
+
         As described in section 3.2.4.2.1, proximity to critical infrastructure
         is a key scoring factor. This method tracks how many infrastructure items
         of each type are within the candidate's buffer zone.
-        
+
         Args:
             infra_name: Name of the infrastructure type
             count: Number of infrastructure items found
         """
-        if infra_name not in self.infrastructures:
-            self.infrastructures[infra_name] = {
-                'count': 0,
-                'raw_score': 0,
-                'normalized_score': 0,
-                'weighted_score': 0,
-                'outage_costs': []  # Add a list to track outage costs for this infra type
-            }
-        self.infrastructures[infra_name]['count'] = count
+        idx = self._infra_slot(infra_name)
+        self.infra_count[idx] = count
     
     def add_infrastructure_outage_cost(self, infra_name, outage_cost):
         """
@@ -154,26 +644,16 @@ class Candidate:
             infra_name: Name of the infrastructure type
             outage_cost: Cost per hour of outage for this infrastructure
         """
-        if infra_name not in self.outage_costs:
-            self.outage_costs[infra_name] = []
-            
         if outage_cost is not None and outage_cost != "NULL":
             try:
                 cost = float(outage_cost)
-                self.outage_costs[infra_name].append(cost)
-                
-                # Also store in infrastructure dict for consistency
-                if infra_name not in self.infrastructures:
-                    self.update_infrastructure_count(infra_name)
-                if 'outage_costs' not in self.infrastructures[infra_name]:
-                    self.infrastructures[infra_name]['outage_costs'] = []
-                    
-                self.infrastructures[infra_name]['outage_costs'].append(cost)
-                
-                if self.feedback:
+                idx = self._infra_slot(infra_name)
+                self.outage_totals[idx] += cost
+
+                if self.verbose:
                     self.feedback.pushInfo(f"Added outage cost {cost} for {infra_name}")
             except (ValueError, TypeError):
-                if self.feedback:
+                if self.verbose:
                     self.feedback.pushInfo(f"Invalid outage cost value: {outage_cost}")
     
     def calculate_total_outage_cost_savings(self):
@@ -186,13 +666,9 @@ class Candidate:
         Returns:
             float: Total potential outage cost savings
         """
-        total = 0
-        for infra_name, costs in self.outage_costs.items():
-            # Only count costs if this infrastructure contributes to the score
-            infra_score = self.infrastructures.get(infra_name, {}).get('weighted_score', 0)
-            if infra_score > 0:
-                total += sum(costs)
-        
+        # Only count costs for infrastructure types that contribute to the
+        # score: one vectorized multiply-and-sum over the running totals
+        total = float((self.outage_totals * (self.infra_weighted > 0)).sum())
         self.total_outage_cost_savings = total
         return total
         
@@ -209,19 +685,11 @@ class Candidate:
             normalized_score: The normalized score (0-1)
             weighted_score: The weighted score (normalized * weight)
         """
-        if infra_name not in self.infrastructures:
-            self.infrastructures[infra_name] = {
-                'count': 0,
-                'raw_score': 0,
-                'normalized_score': 0,
-                'weighted_score': 0,
-                'outage_costs': []  # Initialize outage costs list
-            }
-        
-        self.infrastructures[infra_name]['normalized_score'] = normalized_score
-        
+        idx = self._infra_slot(infra_name)
+        self.infra_norm[idx] = normalized_score
+
         if weighted_score is not None:
-            self.infrastructures[infra_name]['weighted_score'] = weighted_score
+            self.infra_weighted[idx] = weighted_score
         
     def set_infrastructure_raw_score(self, infra_name, raw_score):
         """
@@ -234,14 +702,23 @@ class Candidate:
             infra_name: Name of the infrastructure type
             raw_score: The raw unweighted score
         """
-        if infra_name not in self.infrastructures:
-            self.infrastructures[infra_name] = {
-                'count': 0,
-                'raw_score': 0,
-                'normalized_score': 0,
-                'weighted_score': 0
-            }
-        self.infrastructures[infra_name]['raw_score'] = raw_score
+        idx = self._infra_slot(infra_name)
+        self.infra_raw[idx] = raw_score
+
+    def get_infrastructure_raw_score(self, infra_name):
+        """
+        Get the raw score for an infrastructure type.
+
+        Args:
+            infra_name: Name of the infrastructure type
+
+        Returns:
+            float: The raw score or 0 if not found
+        """
+        idx = INFRA_INDEX.get(infra_name)
+        if idx is None or idx >= self.infra_raw.shape[0]:
+            return 0
+        return float(self.infra_raw[idx])
             
     def set_census_data_score(self, variable, weighted_score):
         """
@@ -254,9 +731,8 @@ class Candidate:
             variable: Census variable name
             weighted_score: The weighted normalized score for this census variable
         """
-        # Store in both places for backward compatibility during transition
-        self.census_data[variable + "_score"] = weighted_score
-        self.census_scores[variable] = weighted_score
+        idx = self._census_slot(variable)
+        self.census_score_arr[idx] = weighted_score
         
     def set_critical_zone_score(self, zone_type, score):
         """
@@ -270,8 +746,9 @@ class Candidate:
             zone_type: Name of the critical zone
             score: Direct score modifier (can be positive or negative)
         """
-        self.critical_zones[zone_type] = score
-        
+        idx = self._zone_slot(zone_type)
+        self.zone_score_arr[idx] = score
+
     def calculate_final_score(self):
         """
         Calculate the final score using the unified scoring system from section 3.2.4.3.
@@ -282,22 +759,22 @@ class Candidate:
         Returns:
             float: The final score
         """
-        # Calculate infrastructure score using weighted scores
-        infrastructure_score = sum(info.get('weighted_score', 0) 
-                                 for info in self.infrastructures.values())
+        # Calculate infrastructure score using weighted scores (one array sum)
+        infrastructure_score = float(self.infra_weighted.sum())
         self.total_infra_score = infrastructure_score
         
         # Sum census data scores (which are already weighted)
-        census_score = sum(self.census_scores.values())
+        census_score = float(self.census_score_arr.sum())
         self.total_census_score = census_score
-        
+
         # Sum critical zone scores (direct modifiers)
-        critical_zone_score = sum(self.critical_zones.values())
+        critical_zone_score = float(self.zone_score_arr.sum())
         self.total_zone_score = critical_zone_score
         
         # Calculate final score: (weighted scores) + (zone modifiers)
         self.final_score = infrastructure_score + census_score + critical_zone_score
-        
+        self._final_dirty = False
+
         return self.final_score
         
     def generate_output_attributes(self):
@@ -310,62 +787,18 @@ class Candidate:
         Returns:
             list: Attributes for the output feature
         """
-        # Get proper ID for the feature
-        feature_id = self.id  # Default to internal ID
-        
-        # Try different ID field variations
-        if 'Id' in self.feature.fields().names():
-            feature_id = self.feature['Id']
-            if self.feedback:
-                self.feedback.pushInfo(f"Using 'Id' field value: {feature_id}")
-        elif 'ID' in self.feature.fields().names():
-            feature_id = self.feature['ID'] 
-            if self.feedback:
-                self.feedback.pushInfo(f"Using 'ID' field value: {feature_id}")
-        elif 'id' in self.feature.fields().names():
-            feature_id = self.feature['id']
-            if self.feedback:
-                self.feedback.pushInfo(f"Using 'id' field value: {feature_id}")
-        else:
-            if self.feedback:
-                self.feedback.pushInfo(f"No Id field found, using internal ID: {feature_id}")
-        
-        # Get proper Name for the feature
-        feature_name = None
-        
-        # Try different Name field variations
-        if 'Name' in self.feature.fields().names():
-            feature_name = str(self.feature['Name'])
-            if self.feedback:
-                self.feedback.pushInfo(f"Using 'Name' field value: {feature_name}")
-        elif 'name' in self.feature.fields().names():
-            feature_name = str(self.feature['name'])
-            if self.feedback:
-                self.feedback.pushInfo(f"Using 'name' field value: {feature_name}")
-        elif 'NAME' in self.feature.fields().names():
-            feature_name = str(self.feature['NAME'])
-            if self.feedback:
-                self.feedback.pushInfo(f"Using 'NAME' field value: {feature_name}")
-        
-        # If no name was found, use Id as the name
-        if not feature_name:
-            feature_name = f'Candidate {feature_id}'
-            if self.feedback:
-                self.feedback.pushInfo(f"No Name field found, using ID as name: {feature_name}")
-        
-        # Start building attributes list with ID and name
-        attributes = [feature_id, feature_name]
-        
-        # Add infrastructure attributes
-        for infra_type, info in self.infrastructures.items():
-            attributes.append(info.get('count', 0))
-            attributes.append(info.get('raw_score', 0))
-            attributes.append(info.get('weighted_score', 0))
-            
-            # Add outage costs if available
-            outage_costs = self.outage_costs.get(infra_type, [])
-            total_type_cost = sum(outage_costs)
-            attributes.append(total_type_cost)
+        # ID and name were resolved once in __init__ via integer field indices,
+        # so the row starts straight from the cached values
+        attributes = [self.field_id, self.field_name]
+        
+        # Add infrastructure attributes. The schema is fixed by the shared
+        # index maps, so the row comes straight out of the parallel arrays in
+        # index order with no per-candidate dict traversal
+        for idx in range(self.infra_count.shape[0]):
+            attributes.append(int(self.infra_count[idx]))
+            attributes.append(float(self.infra_raw[idx]))
+            attributes.append(float(self.infra_weighted[idx]))
+            attributes.append(float(self.outage_totals[idx]))
         
         # Add total infrastructure score
         attributes.append(self.total_infra_score)
@@ -373,16 +806,15 @@ class Candidate:
         # Add total outage cost savings (independent economic metric)
         attributes.append(self.calculate_total_outage_cost_savings())
         
-        # Add census data values and scores
-        for variable, value in self.census_data.items():
-            if not variable.endswith("_score"):  # Only include raw values
-                attributes.append(value)
-                score = self.census_scores.get(variable, 0)
-                attributes.append(score)
-                
+        # Add census data values and scores (raw and weighted arrays are
+        # parallel, so the pairs come straight out in index order)
+        for idx in range(self.census_raw_arr.shape[0]):
+            attributes.append(float(self.census_raw_arr[idx]))
+            attributes.append(float(self.census_score_arr[idx]))
+
         # Add zone scores
-        for zone_type, score in self.critical_zones.items():
-            attributes.append(score)
+        for idx in range(self.zone_score_arr.shape[0]):
+            attributes.append(float(self.zone_score_arr[idx]))
             
         # Add total zone score
         attributes.append(self.total_zone_score)
@@ -390,18 +822,14 @@ class Candidate:
         # Add total demographic/census score
         attributes.append(self.total_census_score)
         
-        # Add final score - ensure this is not NULL
-        if hasattr(self, 'final_score') and self.final_score is not None:
-            attributes.append(self.final_score)
-            if self.feedback:
-                self.feedback.pushInfo(f"Adding final score: {self.final_score}")
-        else:
-            # Calculate final score if not already calculated
-            final_score = self.calculate_final_score()
-            attributes.append(final_score)
-            if self.feedback:
-                self.feedback.pushInfo(f"Adding newly calculated final score: {final_score}")
-        
+        # Add final score - recalculate only when it was never computed, so
+        # the output never carries the initialization placeholder
+        if self._final_dirty:
+            self.calculate_final_score()
+        attributes.append(self.final_score)
+        if self.verbose:
+            self.feedback.pushInfo(f"Adding final score: {self.final_score}")
+
         return attributes
         
     def set_census_data(self, variable_name, value):
@@ -415,41 +843,45 @@ class Candidate:
             variable_name: Name of the census variable
             value: The raw value
         """
-        self.census_data[variable_name] = value
+        idx = self._census_slot(variable_name)
+        self.census_raw_arr[idx] = value
 
     def calculate_total_census_score(self):
         """
         Calculate the total census score as sum of all normalized scores.
-        
+
         Returns:
             float: Total census score component
         """
-        if self.census_scores:
-            self.total_census_score = sum(self.census_scores.values())
-        else:
-            self.total_census_score = 0
+        self.total_census_score = float(self.census_score_arr.sum())
         return self.total_census_score
-        
+
     def get_census_data(self, variable_name):
         """
         Get raw census data for a variable.
-        
+
         Args:
             variable_name: Name of the census variable
-            
+
         Returns:
             float: The raw census value or 0 if not found
         """
-        return self.census_data.get(variable_name, 0)
-        
+        idx = CENSUS_INDEX.get(variable_name)
+        if idx is None or idx >= self.census_raw_arr.shape[0]:
+            return 0
+        return float(self.census_raw_arr[idx])
+
     def get_census_score(self, variable_name):
         """
         Get normalized score for a census variable.
-        
+
         Args:
             variable_name: Name of the census variable
-            
+
         Returns:
             float: The normalized score or 0 if not found
         """
-        return self.census_scores.get(variable_name, 0)
\ No newline at end of file
+        idx = CENSUS_INDEX.get(variable_name)
+        if idx is None or idx >= self.census_score_arr.shape[0]:
+            return 0
+        return float(self.census_score_arr[idx])
\ No newline at end of file
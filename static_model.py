@@ -4,18 +4,86 @@ for evaluating potential sites for static energy storage facilities as described
 methodology section 3.2 (Static Energy Storage Systems Model).
 """
 
-from qgis.core import (QgsProcessingException, QgsFeature, QgsFields, QgsField,
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
+
+from qgis.core import (QgsProcessingException, QgsFeature, QgsFeatureRequest,
+                      QgsFields, QgsField,
                       QgsWkbTypes, QgsFeatureSink, QgsPointXY, QgsProject,
                       QgsCoordinateTransform, QgsCoordinateReferenceSystem,
-                      QgsGeometry, QgsRectangle)
+                      QgsGeometry, QgsRectangle, QgsSpatialIndex)
 from qgis.PyQt.QtCore import QVariant
 from .road_network_analyzer import RoadNetworkAnalyzer
+from .static_candidate import INFRA_INDEX, CENSUS_INDEX
+
+
+def _stack(arrays, min_width=0):
+    """
+    Pack per-candidate score arrays into one (N x M) float matrix.
+
+    Candidates store scores in SoA numpy arrays indexed through the shared
+    name->index maps, so batch scoring is a straight stack of those arrays,
+    zero-padded in case a candidate missed a late-registered name.
+
+    Args:
+        arrays: List of 1-D numpy arrays, one per candidate
+        min_width: Minimum number of columns (e.g. highest index in use + 1)
+
+    Returns:
+        numpy.ndarray: (len(arrays) x width) float64 matrix
+    """
+    width = max([min_width] + [arr.shape[0] for arr in arrays])
+    packed = np.zeros((len(arrays), width), dtype=np.float64)
+    for i, arr in enumerate(arrays):
+        packed[i, :arr.shape[0]] = arr
+    return packed
+
+
+class _QueuedFeedback:
+    """
+    Collects feedback messages emitted from worker threads.
+
+    Qt feedback objects must only be driven from the algorithm thread, so
+    parallel phases log into this shim (list.append is atomic under the
+    GIL) and the messages are replayed on the algorithm thread, either
+    incrementally while results are consumed or once the pool has joined.
+    """
+
+    def __init__(self):
+        self.messages = []
+
+    def pushInfo(self, message):
+        self.messages.append(('info', message))
+
+    def pushWarning(self, message):
+        self.messages.append(('warning', message))
+
+    def reportError(self, message):
+        self.messages.append(('error', message))
+
+    def flush(self, feedback):
+        # Drain with atomic pops so a flush racing against worker appends
+        # (mid-phase replay) can never drop a message
+        while self.messages:
+            kind, message = self.messages.pop(0)
+            if kind == 'info':
+                feedback.pushInfo(message)
+            elif kind == 'warning':
+                feedback.pushWarning(message)
+            else:
+                feedback.reportError(message)
+
 
 class StaticEnergyStorageEvaluator:
     def __init__(self, feedback=None):
         """Initialize the evaluator with optional feedback mechanism."""
         self.feedback = feedback
         self.road_analyzer = RoadNetworkAnalyzer()
+        # Per-feature detail logs only run when the feedback asks for
+        # verbose output, matching the mobile model and candidate classes
+        self.verbose = feedback is not None and getattr(feedback, 'isVerbose', lambda: False)()
 
     def log(self, message):
         """Log a message if feedback is available."""
@@ -61,16 +129,16 @@ class StaticEnergyStorageEvaluator:
                 f"does not match number of census variables ({census_count})"
             )
 
-        # All weights must sum to 1.0
-        total_sum = sum(infra_weights) + sum(census_weights)
-        if not 0.999 <= total_sum <= 1.001:
+        # All weights must sum to 1.0; the total is computed once and reused
+        # for the exact-normalization step below
+        weight_sum = sum(infra_weights) + sum(census_weights)
+        if not 0.999 <= weight_sum <= 1.001:
             raise QgsProcessingException(
-                f"Total of all weights ({total_sum}) must equal 1.0. "
+                f"Total of all weights ({weight_sum}) must equal 1.0. "
                 "This includes both infrastructure and census weights."
             )
 
         # Normalize weights to exactly 1.0 if needed
-        weight_sum = sum(infra_weights) + sum(census_weights)
         if weight_sum != 1.0:
             factor = 1.0 / weight_sum
             infra_weights = [w * factor for w in infra_weights]
@@ -78,119 +146,332 @@ class StaticEnergyStorageEvaluator:
 
         return infra_weights, census_weights
 
-    def evaluate_critical_zones(self, candidates, zone_layers, zone_scores):
+    def evaluate_critical_zones(self, candidates, zone_layers, zone_scores, spatial_cache=None):
         """
         Evaluate candidates against critical zones and apply scores.
-        
+
         As described in section 3.2.4.2.3 (Location within Critical Zones), critical zone
         scores are direct modifiers to the final score and not part of the weighted system.
         These can be positive or negative values depending on whether the zone is favorable
         or unfavorable for ESS deployment.
-        
+
         Args:
             candidates: List of Candidate objects
             zone_layers: List of zone layers
             zone_scores: List of scores corresponding to zone layers
+            spatial_cache: Optional dict of layer id -> (QgsSpatialIndex,
+                {feature id: feature}, coords). With an index, a candidate
+                point only tests the zone polygons whose bounding boxes
+                contain it instead of scanning the whole layer
         """
-        for candidate in candidates:
-            candidate_id = candidate.feature.id() if hasattr(candidate.feature, 'id') else 'unknown'
-            self.log(f"Evaluating critical zones for candidate {candidate_id}")
-            
-            for i, zone_layer in enumerate(zone_layers):
-                zone_name = zone_layer.name()
-                zone_score = zone_scores[i]
-                
-                for zone_feature in zone_layer.getFeatures():
-                    if zone_feature.geometry().intersects(candidate.feature.geometry()):
-                        # Apply the zone score as a direct modifier as per methodology section 3.2.4.3
-                        candidate.set_critical_zone_score(zone_name, zone_score)
-                        self.log(f"Candidate intersects with {zone_name}, applying score: {zone_score}")
-                        break
-                    else:
-                        candidate.set_critical_zone_score(zone_name, 0)
-
-    def evaluate_infrastructure(self, candidate, infra_layers, infra_weights, buffer_distance, distance_method):
+        for i, zone_layer in enumerate(zone_layers):
+            zone_name = zone_layer.name()
+            zone_score = zone_scores[i]
+            self.log(f"Evaluating critical zone layer {zone_name}")
+
+            snapshot = spatial_cache.get(zone_layer.id()) if spatial_cache else None
+            if snapshot is not None:
+                index, feature_map = snapshot[0], snapshot[1]
+            else:
+                # Read the layer once and build a local index so every
+                # candidate still pays only a bounding-box probe instead of
+                # testing each zone polygon
+                feature_map = {feature.id(): feature
+                               for feature in zone_layer.getFeatures(
+                                   QgsFeatureRequest().setNoAttributes())}
+                index = QgsSpatialIndex()
+                for feature in feature_map.values():
+                    index.addFeature(feature)
+
+            for candidate in candidates:
+                geom = candidate.feature.geometry()
+                hits = (feature_map[fid] for fid in index.intersects(geom.boundingBox()))
+                intersecting = any(zone_feature.geometry().intersects(geom)
+                                   for zone_feature in hits)
+                # Apply the zone score as a direct modifier as per methodology section 3.2.4.3
+                candidate.set_critical_zone_score(zone_name, zone_score if intersecting else 0)
+
+    def evaluate_infrastructure(self, candidate, infra_layers, infra_weights, buffer_distance, distance_method,
+                                spatial_cache=None):
         """
         Evaluate a candidate against infrastructure layers using the specified distance method.
         Also gather outage costs for infrastructure features within the buffer.
-        
+
         As described in section 3.2.4.2.1 (Proximity to Critical Infrastructure), this calculates
         a score based on the proximity of the candidate to critical infrastructures.
-        
+
         The buffer analysis (section 3.2.2.2) defines the service area around each candidate.
         The score formula follows Sinfra = ∑(Dbuffer - Dactual) as described in section 3.2.4.3.
-        
+
         Args:
             candidate: Candidate object to evaluate
             infra_layers: List of infrastructure layers
             infra_weights: List of weights for each infrastructure layer
             buffer_distance: Distance in kilometers for buffer analysis
             distance_method: Method for distance calculation (0=Road, 1=Haversine)
+            spatial_cache: Optional dict of layer id -> (QgsSpatialIndex,
+                {feature id: feature}) built once per run; when present only
+                features whose bounding box overlaps the candidate's buffer
+                reach the exact intersection test
         """
         for i, layer in enumerate(infra_layers):
             infra_name = layer.name()
-            weight = infra_weights[i]
-            
-            # Calculate scores based on distances to infrastructure
-            total_score = 0
-            infra_count = 0
-            
-            for feature in layer.getFeatures():
-                # Only consider infrastructure within the candidate's buffer (service area)
-                if feature.geometry().intersects(candidate.buffer):
-                    infra_count += 1
-                    start_point = candidate.feature.geometry().asPoint()
+            # The outage field is part of the layer schema, probed once here
+            # instead of once per feature in the scoring pass
+            outage_idx = layer.fields().lookupField('outage_cos')
+
+            snapshot = spatial_cache.get(layer.id()) if spatial_cache else None
+            if snapshot is not None:
+                index, feature_map, coords = snapshot
+                features = [feature_map[fid]
+                            for fid in index.intersects(candidate.buffer_bbox)]
+            else:
+                # No in-memory index: push the bounding-box filter down to the
+                # provider, whose own spatial index prunes far-away features
+                # before they are ever streamed into Python
+                request = QgsFeatureRequest().setFilterRect(candidate.buffer_bbox)
+                features = layer.getFeatures(request)
+                coords = None
+
+            infra_count, total_score = self._score_layer_hits(
+                candidate, infra_name, features, buffer_distance, distance_method,
+                coords=coords, outage_idx=outage_idx
+            )
+
+            # Update candidate with counts and raw scores in one fused write
+            candidate.apply_infra(infra_name, infra_count, total_score)
+
+    def evaluate_infrastructure_batch(self, candidates, infra_layers, infra_weights, buffer_distance,
+                                      distance_method, spatial_cache=None):
+        """
+        Evaluate all candidates against all infrastructure layers in one pass.
+
+        Calling evaluate_infrastructure once per candidate re-resolves the
+        layer snapshot and layer name for every candidate. Running the batch
+        layer-major hoists that work out of the inner loop and, when no
+        spatial index is available, reads each layer from its provider once
+        instead of once per candidate.
+
+        Args:
+            candidates: List of Candidate objects to evaluate
+            infra_layers: List of infrastructure layers
+            infra_weights: List of weights for each infrastructure layer
+            buffer_distance: Distance in meters for buffer analysis
+            distance_method: Method for distance calculation (0=Road, 1=Haversine)
+            spatial_cache: Optional dict of layer id -> (QgsSpatialIndex,
+                {feature id: feature}); see evaluate_infrastructure
+        """
+        for i, layer in enumerate(infra_layers):
+            infra_name = layer.name()
+            outage_idx = layer.fields().lookupField('outage_cos')
+            snapshot = spatial_cache.get(layer.id()) if spatial_cache else None
+
+            if snapshot is not None:
+                index, feature_map, coords = snapshot
+                # Per-candidate hit lists from one index, resolved up front
+                hits = [[feature_map[fid]
+                         for fid in index.intersects(candidate.buffer_bbox)]
+                        for candidate in candidates]
+            else:
+                # No index: materialize the layer once, filtered at the
+                # provider to the combined extent of all candidate buffers;
+                # the exact intersection test in the scoring pass does the rest
+                extent = QgsRectangle()
+                for candidate in candidates:
+                    if candidate.buffer is not None:
+                        extent.combineExtentWith(candidate.buffer_bbox)
+                request = QgsFeatureRequest().setFilterRect(extent)
+                shared = list(layer.getFeatures(request))
+                hits = [shared] * len(candidates)
+                coords = None
+
+            if self.feedback is not None and self.feedback.isCanceled():
+                return
+
+            if distance_method == 0 and len(candidates) > 1:
+                # Road distances are HTTP round-trips to the routing service,
+                # so scoring candidates concurrently overlaps network latency.
+                # Each task only touches its own candidate. The GEOS/Haversine
+                # path stays serial: those calls hold the GIL, so threads
+                # would add overhead without concurrency.
+                # Qt feedback must stay on the algorithm thread, so worker
+                # messages (including candidate verbose logs) queue into a
+                # shim that the result loop below replays as candidates
+                # complete. This is the longest phase of a road-distance run
+                # (one HTTP round-trip per candidate/feature pair), so the
+                # result loop also owns intra-phase progress and honors
+                # cancellation between completed candidates instead of only
+                # between layers.
+                queued = _QueuedFeedback()
+                saved_feedback = [candidate.feedback for candidate in candidates]
+                for candidate in candidates:
+                    candidate.feedback = queued
+                results = {}
+                cancelled = False
+                progress_step = max(1, len(candidates) // 100)
+                layer_span = 40.0 / len(infra_layers)
+                layer_base = 30.0 + i * layer_span
+                try:
+                    with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                        futures = {
+                            executor.submit(
+                                self._score_layer_hits, candidate, infra_name,
+                                features, buffer_distance, distance_method,
+                                coords=coords, outage_idx=outage_idx,
+                                log=queued.pushInfo): candidate
+                            for candidate, features in zip(candidates, hits)}
+                        for done, future in enumerate(as_completed(futures), start=1):
+                            results[futures[future]] = future.result()
+                            if self.feedback is None:
+                                continue
+                            if self.feedback.isCanceled():
+                                for pending in futures:
+                                    pending.cancel()
+                                cancelled = True
+                                break
+                            if done % progress_step == 0:
+                                self.feedback.setProgress(
+                                    int(layer_base + done * layer_span / len(candidates)))
+                                queued.flush(self.feedback)
+                finally:
+                    for candidate, fb in zip(candidates, saved_feedback):
+                        candidate.feedback = fb
+                    if self.feedback is not None:
+                        queued.flush(self.feedback)
+                for candidate in candidates:
+                    if candidate in results:
+                        infra_count, total_score = results[candidate]
+                        candidate.apply_infra(infra_name, infra_count, total_score)
+                if cancelled:
+                    return
+            else:
+                for candidate, features in zip(candidates, hits):
+                    if self.feedback is not None and self.feedback.isCanceled():
+                        return
+                    infra_count, total_score = self._score_layer_hits(
+                        candidate, infra_name, features, buffer_distance, distance_method,
+                        coords=coords, outage_idx=outage_idx
+                    )
+                    candidate.apply_infra(infra_name, infra_count, total_score)
+
+    def _score_layer_hits(self, candidate, infra_name, features, buffer_distance, distance_method,
+                          coords=None, outage_idx=None, log=None):
+        """
+        Score one candidate against candidate infrastructure features.
+
+        Implements the per-feature part of section 3.2.4.3: only features
+        intersecting the candidate's buffer contribute, each scored as
+        Dbuffer - Dactual, with outage costs collected for scoring features.
+
+        Args:
+            candidate: Candidate object to evaluate
+            infra_name: Name of the infrastructure layer being scored
+            features: Iterable of candidate features (may include misses;
+                the exact buffer intersection test is applied here)
+            buffer_distance: Distance in meters for buffer analysis
+            distance_method: Method for distance calculation (0=Road, 1=Haversine)
+            coords: Optional {feature id: (x, y)} map extracted once per
+                layer, so distance math skips per-pair asPoint() calls
+            outage_idx: Index of the outage_cos field in the layer schema,
+                or a negative value when absent; resolved from the first hit
+                when not given. Fields are schema-level, so callers can probe
+                the layer once instead of per feature
+            log: Message sink; defaults to self.log. Threaded callers pass a
+                queued shim because Qt feedback must stay on the algorithm
+                thread
+
+        Returns:
+            tuple: (count of intersecting features, total raw score)
+        """
+        if log is None:
+            log = self.log
+        # The buffer is probed once per candidate feature; the prepared engine
+        # pays the GEOS indexing cost once instead of per probe
+        engine = candidate.prepared_buffer()
+        if engine is None:
+            return 0, 0
+
+        # Candidate start coordinates were cached at construction
+        start_xy = candidate.point_xy
+        if start_xy is None:
+            start_point = candidate.feature.geometry().asPoint()
+            start_xy = (start_point.x(), start_point.y())
+
+        # Only infrastructure within the candidate's buffer (service area)
+        # contributes; collect the hits first so the distance math below can
+        # run over whole arrays
+        hits = []
+        for feature in features:
+            if engine.intersects(feature.geometry().constGet()):
+                end_xy = coords.get(feature.id()) if coords else None
+                if end_xy is None:
                     end_point = feature.geometry().asPoint()
-                    
-                    # Calculate distance based on method selected by user
-                    # As described in section 3.2.2.1 (Distance Calculations)
-                    if distance_method == 0:  # Road distance through network
-                        try:
-                            distance = self.road_analyzer.calculate_road_distance(
-                                start_point.x(), start_point.y(),
-                                end_point.x(), end_point.y()
-                            )
-                        except Exception as e:
-                            self.log(f"Road distance calculation failed: {str(e)}, using Haversine")
-                            # Transform coordinates to get lon/lat
-                            start_lon, start_lat = self.road_analyzer.transform_coordinates(
-                                start_point.x(), start_point.y()
-                            )
-                            end_lon, end_lat = self.road_analyzer.transform_coordinates(
-                                end_point.x(), end_point.y()
-                            )
-                            distance = self.road_analyzer.haversine_distance(
-                                start_lon, start_lat, end_lon, end_lat
-                            )
-                    else:  # Haversine distance (straight-line)
-                        # Transform coordinates to get lon/lat for haversine calculation
-                        start_lon, start_lat = self.road_analyzer.transform_coordinates(
-                            start_point.x(), start_point.y()
-                        )
-                        end_lon, end_lat = self.road_analyzer.transform_coordinates(
-                            end_point.x(), end_point.y()
-                        )
-                        distance = self.road_analyzer.haversine_distance(
-                            start_lon, start_lat, end_lon, end_lat
-                        )
-                    
-                    # Score formula: buffer_distance - actual_distance
-                    # Following the formula Sinfra = ∑(Dbuffer - Dactual) from section 3.2.4.3
-                    score = max(0, buffer_distance - distance)
-                    
-                    # Process outage cost for economic analysis (section 3.2.4.3 - Outage Cost Savings)
-                    if score > 0:
-                        # Get outage cost if it exists in the feature
-                        if 'outage_cos' in feature.fields().names():
-                            outage_cost = feature['outage_cos']
-                            self.log(f"Found outage_cos in feature: {outage_cost} (contributes to score)")
-                            candidate.add_infrastructure_outage_cost(infra_name, outage_cost)
-                    
-                    total_score += score
-            
-            # Update candidate with counts and raw scores
-            candidate.update_infrastructure_count(infra_name, infra_count)
-            candidate.set_infrastructure_raw_score(infra_name, total_score)
+                    end_xy = (end_point.x(), end_point.y())
+                hits.append((feature, end_xy))
+
+        infra_count = len(hits)
+        if not hits:
+            return 0, 0
+
+        # Calculate distances based on the method selected by the user
+        # As described in section 3.2.2.1 (Distance Calculations)
+        if distance_method == 0:  # Road distance through network
+            distances = np.empty(infra_count, dtype=np.float64)
+            for j, (feature, end_xy) in enumerate(hits):
+                try:
+                    distances[j] = self.road_analyzer.calculate_road_distance(
+                        start_xy[0], start_xy[1],
+                        end_xy[0], end_xy[1]
+                    )
+                except Exception as e:
+                    log(f"Road distance calculation failed: {str(e)}, using Haversine")
+                    # Transform coordinates to get lon/lat
+                    start_lon, start_lat = self.road_analyzer.transform_coordinates(
+                        start_xy[0], start_xy[1]
+                    )
+                    end_lon, end_lat = self.road_analyzer.transform_coordinates(
+                        end_xy[0], end_xy[1]
+                    )
+                    distances[j] = self.road_analyzer.haversine_distance(
+                        start_lon, start_lat, end_lon, end_lat
+                    )
+        else:  # Haversine distance (straight-line)
+            # One broadcast pass replaces the per-pair scalar haversine calls:
+            # the endpoints are transformed in one batch and the trig runs
+            # over contiguous arrays
+            start_lon, start_lat = self.road_analyzer.transform_coordinates(
+                start_xy[0], start_xy[1]
+            )
+            ends = self.road_analyzer.transform_coordinates_batch(
+                [end_xy for _, end_xy in hits])
+            end_lons = np.fromiter((lon for lon, _ in ends), dtype=np.float64,
+                                   count=infra_count)
+            end_lats = np.fromiter((lat for _, lat in ends), dtype=np.float64,
+                                   count=infra_count)
+            # Rounded to 2 decimals to match the scalar haversine_distance
+            distances = np.round(self.road_analyzer.haversine_matrix(
+                [start_lon], [start_lat], end_lons, end_lats)[0], 2)
+
+        # Score formula: buffer_distance - actual_distance
+        # Following the formula Sinfra = ∑(Dbuffer - Dactual) from section 3.2.4.3
+        scores = np.maximum(0.0, buffer_distance - distances)
+        total_score = float(scores.sum())
+
+        # Process outage costs for economic analysis (section 3.2.4.3 -
+        # Outage Cost Savings): only features that contribute to the score
+        if outage_idx is None:
+            outage_idx = hits[0][0].fields().lookupField('outage_cos')
+        if outage_idx >= 0:
+            for (feature, _), score in zip(hits, scores):
+                if score > 0:
+                    # attribute(idx) skips the per-access name resolution that
+                    # feature['outage_cos'] performs
+                    outage_cost = feature.attribute(outage_idx)
+                    if self.verbose:
+                        log(f"Found outage_cos in feature: {outage_cost} (contributes to score)")
+                    candidate.add_infrastructure_outage_cost(infra_name, outage_cost)
+
+        return infra_count, total_score
 
     def normalize_and_weight_scores(self, candidates, infra_layers, census_variables, infra_weights, census_weights):
         """
@@ -207,59 +488,71 @@ class StaticEnergyStorageEvaluator:
             infra_weights: List of weights for infrastructure layers
             census_weights: List of weights for census variables
         """
-        # Find global min/max for infrastructure scores
-        global_infra_min = float('inf')
-        global_infra_max = float('-inf')
-        
-        for candidate in candidates:
-            for infra_name in [layer.name() for layer in infra_layers]:
-                score = candidate.infrastructures.get(infra_name, {}).get('raw_score', 0)
-                global_infra_min = min(global_infra_min, score)
-                global_infra_max = max(global_infra_max, score)
-        
-        # Find global min/max for census values
-        census_ranges = {var: {'min': float('inf'), 'max': float('-inf')} 
-                        for var in census_variables}
-        
-        for candidate in candidates:
-            for var in census_variables:
-                value = candidate.census_data.get(var, 0)
-                census_ranges[var]['min'] = min(census_ranges[var]['min'], value)
-                census_ranges[var]['max'] = max(census_ranges[var]['max'], value)
-        
-        # Apply normalization and weights
-        for candidate in candidates:
-            # Infrastructure scores - following Min-Max Normalization formula:
-            # Sinfra-normalized = (Sinfra - Sinfra-min) / (Sinfra-max - Sinfra-min)
-            for i, layer in enumerate(infra_layers):
-                infra_name = layer.name()
-                raw_score = candidate.infrastructures.get(infra_name, {}).get('raw_score', 0)
-                
-                # Normalize using Min-Max scaling
-                if global_infra_max > global_infra_min:
-                    norm_score = (raw_score - global_infra_min) / (global_infra_max - global_infra_min)
-                else:
-                    norm_score = 1.0 if raw_score > 0 else 0.0
-                
-                # Apply weight: Sinfra-weighted = Sinfra-normalized × Winfra
-                weighted_score = norm_score * infra_weights[i]
-                candidate.set_infrastructure_score(infra_name, norm_score, weighted_score)
-            
-            # Census scores - following same normalization approach
-            for i, var in enumerate(census_variables):
-                value = candidate.census_data.get(var, 0)
-                var_min = census_ranges[var]['min']
-                var_max = census_ranges[var]['max']
-                
-                # Normalize census data
-                if var_max > var_min:
-                    norm_score = (value - var_min) / (var_max - var_min)
-                else:
-                    norm_score = 1.0 if value > 0 else 0.0
-                
-                # Apply weight: Scensus-weighted = Scensus-normalized × Wcensus
-                weighted_score = norm_score * census_weights[i]
-                candidate.set_census_data_score(var, weighted_score)
+        if not candidates:
+            return
+
+        # Resolve each layer/variable to its column in the shared SoA layout,
+        # registering any name the evaluation pass has not touched yet
+        infra_cols = []
+        for layer in infra_layers:
+            name = layer.name()
+            if name not in INFRA_INDEX:
+                INFRA_INDEX[name] = len(INFRA_INDEX)
+            infra_cols.append(INFRA_INDEX[name])
+
+        census_cols = []
+        for var in census_variables:
+            if var not in CENSUS_INDEX:
+                CENSUS_INDEX[var] = len(CENSUS_INDEX)
+            census_cols.append(CENSUS_INDEX[var])
+
+        # Infrastructure scores - following Min-Max Normalization formula:
+        # Sinfra-normalized = (Sinfra - Sinfra-min) / (Sinfra-max - Sinfra-min)
+        # The min/max are global across all infrastructure types, so the whole
+        # normalization is three vectorized passes over one (N x K) matrix
+        # instead of nested Python loops over candidates and layers
+        if infra_cols:
+            width = max(infra_cols) + 1
+            raw = _stack([c.infra_raw for c in candidates], width)[:, infra_cols]
+
+            global_infra_min = raw.min()
+            global_infra_max = raw.max()
+            if global_infra_max > global_infra_min:
+                norm = (raw - global_infra_min) / (global_infra_max - global_infra_min)
+            else:
+                norm = (raw > 0).astype(np.float64)
+
+            # Apply weight: Sinfra-weighted = Sinfra-normalized × Winfra
+            weighted = norm * np.asarray(infra_weights, dtype=np.float64)
+
+            for i, candidate in enumerate(candidates):
+                for j, col in enumerate(infra_cols):
+                    if col >= candidate.infra_norm.shape[0]:
+                        candidate._infra_slot(infra_layers[j].name())
+                candidate.infra_norm[infra_cols] = norm[i]
+                candidate.infra_weighted[infra_cols] = weighted[i]
+
+        # Census scores - same normalization approach, but each variable is
+        # normalized against its own per-column min/max
+        if census_cols:
+            width = max(census_cols) + 1
+            values = _stack([c.census_raw_arr for c in candidates], width)[:, census_cols]
+
+            var_min = values.min(axis=0)
+            var_max = values.max(axis=0)
+            span = var_max - var_min
+            norm = np.where(span > 0,
+                            (values - var_min) / np.where(span > 0, span, 1.0),
+                            (values > 0).astype(np.float64))
+
+            # Apply weight: Scensus-weighted = Scensus-normalized × Wcensus
+            weighted = norm * np.asarray(census_weights, dtype=np.float64)
+
+            for i, candidate in enumerate(candidates):
+                for j, col in enumerate(census_cols):
+                    if col >= candidate.census_score_arr.shape[0]:
+                        candidate._census_slot(census_variables[j])
+                candidate.census_score_arr[census_cols] = weighted[i]
 
     def calculate_final_scores(self, candidates):
         """
@@ -277,27 +570,35 @@ class StaticEnergyStorageEvaluator:
         Args:
             candidates: List of candidate objects to calculate scores for
         """
-        for candidate in candidates:
-            # Sum of all weighted infrastructure scores
-            infra_total = sum(info.get('weighted_score', 0) 
-                            for info in candidate.infrastructures.values())
-            candidate.total_infra_score = infra_total
-            
-            # Sum of all weighted census scores
-            census_total = sum(candidate.census_scores.values())
-            candidate.total_census_score = census_total
-            
-            # Sum of critical zone scores (direct modifiers)
-            zone_total = sum(candidate.critical_zones.values())
-            candidate.total_zone_score = zone_total
-            
-            # Final score: (weighted scores) + (zone modifiers)
-            # Following the formula: Sfinal-total = Sinfra+census-final + Scritical-zone-score
-            final_score = (infra_total + census_total) + zone_total
-            candidate.final_score = final_score
-            
+        if not candidates:
+            return
+
+        # Every candidate carries the same score names, so the per-candidate
+        # scores can be packed into (N x M) float arrays and reduced in a few
+        # vectorized numpy calls instead of N rounds of Python dict iteration
+        infra_weighted = _stack([c.infra_weighted for c in candidates])
+        census_weighted = _stack([c.census_score_arr for c in candidates])
+        zone_scores = _stack([c.zone_score_arr for c in candidates])
+
+        infra_totals = infra_weighted.sum(axis=1)
+        census_totals = census_weighted.sum(axis=1)
+        zone_totals = zone_scores.sum(axis=1)
+
+        # Final score: (weighted scores) + (zone modifiers)
+        # Following the formula: Sfinal-total = Sinfra+census-final + Scritical-zone-score
+        final_scores = (infra_totals + census_totals) + zone_totals
+
+        for i, candidate in enumerate(candidates):
+            candidate.total_infra_score = float(infra_totals[i])
+            candidate.total_census_score = float(census_totals[i])
+            candidate.total_zone_score = float(zone_totals[i])
+            candidate.final_score = float(final_scores[i])
+            candidate._final_dirty = False
+
             # Calculate outage cost savings (separate economic metric as per section 3.2.4.3)
             outage_savings = candidate.calculate_total_outage_cost_savings()
-            
-            self.log(f"Candidate scores: infra={infra_total:.4f}, census={census_total:.4f}, "
-                    f"zones={zone_total:.4f}, final={final_score:.4f}, outage_savings=${outage_savings:.2f}")
\ No newline at end of file
+
+            self.log(f"Candidate scores: infra={candidate.total_infra_score:.4f}, "
+                    f"census={candidate.total_census_score:.4f}, "
+                    f"zones={candidate.total_zone_score:.4f}, "
+                    f"final={candidate.final_score:.4f}, outage_savings=${outage_savings:.2f}")
\ No newline at end of file